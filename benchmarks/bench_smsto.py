@@ -0,0 +1,320 @@
+"""Offline benchmarks for the SMS.to integration.
+
+Starts the local stub server (see stub_server.py), points the integration
+at it and drives either the API client directly or the full notify.smsto
+service, then reports throughput, latency percentiles and event-loop lag.
+
+    python benchmarks/bench_smsto.py --mode service --requests 2000 --concurrency 50
+    python benchmarks/bench_smsto.py --mode notify --error-rate 0.05 --rate-limit 20
+
+``--mode service`` needs Home Assistant and aiohttp installed; ``--mode
+notify`` additionally needs pytest-homeassistant-custom-component, which
+provides an in-memory Home Assistant instance.
+"""
+import argparse
+import asyncio
+import os
+from pathlib import Path
+import socket
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Awaitable, Callable
+
+import aiohttp
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from custom_components.smsto import const, metrics, notify, session  # noqa: E402
+from custom_components.smsto.breaker import SMSToCircuitBreaker  # noqa: E402
+from custom_components.smsto.metrics import SMSToMetrics  # noqa: E402
+from custom_components.smsto.notify import SMSToNotificationService  # noqa: E402
+from custom_components.smsto.ratelimit import SMSToRateLimiter  # noqa: E402
+from stub_server import SMSToStubServer, StubConfig  # noqa: E402
+
+API_KEY = "benchmark-api-key"
+SENDER_ID = "BENCH"
+TARGET = "+40700000000"
+LOOP_LAG_INTERVAL = 0.01
+
+
+def use_stub(base_url: str) -> None:
+    """Point every SMS.to URL used by the integration at the stub server."""
+    urls = {
+        "API_URL_SEND": f"{base_url}/sms/send",
+        "API_URL_BALANCE": f"{base_url}/api/balance",
+        "API_URL_MESSAGES": f"{base_url}/v2/messages",
+    }
+    for module in (const, notify):
+        for name, url in urls.items():
+            setattr(module, name, url)
+    metrics.ENDPOINT_NAMES.clear()
+    metrics.ENDPOINT_NAMES.update(
+        {
+            urls["API_URL_SEND"]: "send",
+            urls["API_URL_BALANCE"]: "balance",
+            urls["API_URL_MESSAGES"]: "messages",
+        }
+    )
+    session.API_ORIGINS = (f"{base_url}/",)
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of ``values``."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[max(1, round(percent / 100 * len(ordered))) - 1]
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop wakes up a sleeping task."""
+
+    def __init__(self, interval: float = LOOP_LAG_INTERVAL) -> None:
+        """Initialize the monitor."""
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+        self.samples: list[float] = []
+
+    async def _async_run(self) -> None:
+        """Sleep repeatedly and record the overshoot."""
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self._interval)
+            self.samples.append(loop.time() - started - self._interval)
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._task = asyncio.get_running_loop().create_task(self._async_run())
+
+    async def async_stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+async def async_drive(
+    call: Callable[[int], Awaitable[object]], requests: int, concurrency: int
+) -> tuple[list[float], int, float]:
+    """Run ``call(i)`` ``requests`` times with ``concurrency`` workers.
+
+    Returns the latency of every call, the number of failed calls and the
+    wall-clock duration.
+    """
+    latencies: list[float] = []
+    failures = 0
+    counter = iter(range(requests))
+
+    async def _async_worker() -> None:
+        nonlocal failures
+        for index in counter:
+            started = time.perf_counter()
+            try:
+                await call(index)
+            except Exception:  # counted, the benchmark keeps going
+                failures += 1
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(_async_worker() for _ in range(concurrency)))
+    return latencies, failures, time.perf_counter() - started
+
+
+def report(
+    title: str,
+    latencies: list[float],
+    failures: int,
+    duration: float,
+    loop_lag: list[float],
+    stub: SMSToStubServer,
+) -> None:
+    """Print the results of a run."""
+    ms = [latency * 1000 for latency in latencies]
+    lag = [sample * 1000 for sample in loop_lag]
+    print(f"\n== {title} ==")
+    print(f"calls        {len(latencies)} ({failures} failed) in {duration:.2f}s")
+    print(f"throughput   {len(latencies) / duration:.1f} calls/s")
+    print(
+        "latency ms   "
+        f"p50 {percentile(ms, 50):.1f}  p95 {percentile(ms, 95):.1f}  "
+        f"p99 {percentile(ms, 99):.1f}  max {max(ms, default=float('nan')):.1f}"
+    )
+    print(
+        "loop lag ms  "
+        f"mean {statistics.fmean(lag) if lag else float('nan'):.2f}  "
+        f"p99 {percentile(lag, 99):.2f}  max {max(lag, default=float('nan')):.2f}"
+    )
+    print(f"stub         requests {stub.stats.requests}  statuses {stub.stats.statuses}")
+
+
+async def async_bench_service(args: argparse.Namespace, stub: SMSToStubServer) -> int:
+    """Drive SMSToNotificationService directly; return the number of failed calls."""
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit_per_host=const.SESSION_LIMIT_PER_HOST)
+    ) as client:
+        service = SMSToNotificationService(
+            API_KEY,
+            SENDER_ID,
+            client,
+            SMSToRateLimiter(rate=args.client_rate, burst=args.client_burst),
+            breaker=SMSToCircuitBreaker(),
+            metrics=SMSToMetrics(),
+        )
+        operations = {
+            "send": lambda i: service.async_send_message(
+                message=f"Benchmark message {i}", target=[TARGET]
+            ),
+            "bulk": lambda i: service.async_send_bulk(
+                message=f"Benchmark bulk {i}",
+                target=[f"+4070000{n:04d}" for n in range(args.bulk_size)],
+            ),
+            "balance": lambda i: service.async_get_balance(),
+            "messages": lambda i: service.async_get_messages_page(page=1, limit=100),
+        }
+
+        monitor = LoopLagMonitor()
+        monitor.start()
+        latencies, failures, duration = await async_drive(
+            operations[args.operation], args.requests, args.concurrency
+        )
+        await monitor.async_stop()
+
+    report(
+        f"service / {args.operation}", latencies, failures, duration, monitor.samples, stub
+    )
+    print(f"breaker      {service.breaker.attributes()}")
+    print(f"client       {service.metrics.sensor_values()['api_metrics']}")
+    return failures
+
+
+def _free_port() -> int:
+    """Return a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def async_bench_notify(args: argparse.Namespace, stub: SMSToStubServer) -> int:
+    """Drive the notify.smsto service of a set up entry; return the failed calls."""
+    from homeassistant import loader
+    from homeassistant.config_entries import ConfigEntryState
+    from homeassistant.setup import async_setup_component
+    from pytest_homeassistant_custom_component.common import (
+        MockConfigEntry,
+        async_test_home_assistant,
+    )
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        os.symlink(
+            REPO_ROOT / "custom_components", Path(config_dir) / "custom_components"
+        )
+        async with async_test_home_assistant(config_dir=config_dir) as hass:
+            # Allow loading integrations from config_dir/custom_components
+            hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+            await async_setup_component(
+                hass, "http", {"http": {"server_port": _free_port()}}
+            )
+
+            entry = MockConfigEntry(
+                domain=const.DOMAIN,
+                data={
+                    const.CONF_API_KEY: API_KEY,
+                    const.CONF_SENDER_ID: SENDER_ID,
+                    const.CONF_RATE_LIMIT: args.client_rate,
+                    const.CONF_RATE_LIMIT_BURST: args.client_burst,
+                    const.CONF_DEDUP_WINDOW: 0,
+                },
+            )
+            entry.add_to_hass(hass)
+            loaded = await hass.config_entries.async_setup(entry.entry_id)
+            await hass.async_block_till_done()
+            if not loaded or entry.state is not ConfigEntryState.LOADED:
+                # Every call would fail at once and report a bogus throughput
+                raise SystemExit(f"Config entry setup failed (state: {entry.state}).")
+
+            async def _async_call(index: int) -> object:
+                response = await hass.services.async_call(
+                    "notify",
+                    "smsto",
+                    {"message": f"Benchmark message {index}", "target": [TARGET]},
+                    blocking=True,
+                    return_response=True,
+                )
+                if response.get("status") not in ("sent", "queued"):
+                    raise RuntimeError(response)
+                return response
+
+            monitor = LoopLagMonitor()
+            monitor.start()
+            latencies, failures, duration = await async_drive(
+                _async_call, args.requests, args.concurrency
+            )
+            await monitor.async_stop()
+
+            await hass.config_entries.async_unload(entry.entry_id)
+            await hass.async_block_till_done()
+
+    report("notify.smsto", latencies, failures, duration, monitor.samples, stub)
+    return failures
+
+
+async def async_main(args: argparse.Namespace) -> int:
+    """Start the stub server, run the selected benchmark and return the exit code."""
+    stub = SMSToStubServer(
+        StubConfig(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            rate_limit=args.rate_limit,
+            retry_after=args.retry_after,
+        )
+    )
+    use_stub(await stub.async_start())
+    try:
+        if args.mode == "service":
+            failures = await async_bench_service(args, stub)
+        else:
+            failures = await async_bench_notify(args, stub)
+    finally:
+        await stub.async_stop()
+
+    if failures:
+        print(f"\n{failures} call(s) failed.", file=sys.stderr)
+        return 1
+    return 0
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--mode", choices=("service", "notify"), default="service")
+    parser.add_argument(
+        "--operation",
+        choices=("send", "bulk", "balance", "messages"),
+        default="send",
+        help="API call to drive in service mode",
+    )
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--bulk-size", type=int, default=250)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--rate-limit", type=float, default=0.0, help="stub 429 threshold, req/s"
+    )
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument(
+        "--client-rate", type=float, default=1000.0, help="client limiter, req/s"
+    )
+    parser.add_argument("--client-burst", type=int, default=1000)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(async_main(parse_args())))
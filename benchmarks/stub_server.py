@@ -0,0 +1,162 @@
+"""Local stand-in for the SMS.to API, used by the offline benchmarks.
+
+Serves the three endpoints the integration talks to on one local port:
+
+    POST /sms/send      → {"success": true, "message_id": ..., "cost": ...}
+    GET  /api/balance   → {"balance": ..., "currency": "EUR"}
+    GET  /v2/messages   → one page of generated message records
+
+Latency, error rate and rate limiting (429 + Retry-After) are configurable.
+"""
+import asyncio
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from aiohttp import web
+
+
+@dataclass
+class StubConfig:
+    """Behaviour of the stub server."""
+
+    latency_ms: float = 50.0
+    jitter_ms: float = 20.0
+    error_rate: float = 0.0
+    # Requests per second before answering 429 (0 = never)
+    rate_limit: float = 0.0
+    retry_after: int = 1
+    cost_per_message: float = 0.05
+    balance: float = 1000.0
+    total_messages: int = 5000
+
+
+@dataclass
+class StubStats:
+    """What the stub server has seen."""
+
+    requests: dict[str, int] = field(default_factory=dict)
+    statuses: dict[int, int] = field(default_factory=dict)
+
+
+class SMSToStubServer:
+    """aiohttp application imitating the SMS.to API."""
+
+    def __init__(self, config: StubConfig) -> None:
+        """Initialize the server."""
+        self.config = config
+        self.stats = StubStats()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    def _count(self, path: str, status: int) -> None:
+        """Count a request and its response status."""
+        self.stats.requests[path] = self.stats.requests.get(path, 0) + 1
+        self.stats.statuses[status] = self.stats.statuses.get(status, 0) + 1
+
+    def _rate_limited(self) -> bool:
+        """Return True if the request exceeds the configured rate (1 s window)."""
+        if not self.config.rate_limit:
+            return False
+        now = time.monotonic()
+        if now - self._window_start >= 1:
+            self._window_start = now
+            self._window_count = 0
+        self._window_count += 1
+        return self._window_count > self.config.rate_limit
+
+    async def _async_respond(self, request: web.Request, body: dict) -> web.Response:
+        """Apply latency, rate limiting and errors, then answer with ``body``."""
+        config = self.config
+        delay = config.latency_ms + random.uniform(-config.jitter_ms, config.jitter_ms)
+        await asyncio.sleep(max(0.0, delay) / 1000)
+
+        if self._rate_limited():
+            self._count(request.path, 429)
+            return web.json_response(
+                {"success": False, "message": "Too Many Requests"},
+                status=429,
+                headers={"Retry-After": str(config.retry_after)},
+            )
+        if random.random() < config.error_rate:
+            self._count(request.path, 503)
+            return web.json_response(
+                {"success": False, "message": "Service Unavailable"}, status=503
+            )
+
+        self._count(request.path, 200)
+        return web.json_response(body)
+
+    async def _async_send(self, request: web.Request) -> web.Response:
+        """Imitate POST /sms/send."""
+        payload = await request.json()
+        recipients = payload.get("to") or []
+        if isinstance(recipients, str):
+            recipients = [recipients]
+        return await self._async_respond(
+            request,
+            {
+                "success": True,
+                "message": "Message is queued for sending!",
+                "message_id": uuid.uuid4().hex,
+                "cost": round(self.config.cost_per_message * len(recipients), 4),
+            },
+        )
+
+    async def _async_balance(self, request: web.Request) -> web.Response:
+        """Imitate GET /api/balance."""
+        return await self._async_respond(
+            request, {"balance": self.config.balance, "currency": "EUR"}
+        )
+
+    async def _async_messages(self, request: web.Request) -> web.Response:
+        """Imitate GET /v2/messages with generated, newest-first records."""
+        limit = int(request.query.get("limit", 10))
+        page = int(request.query.get("page", 1))
+        total = self.config.total_messages
+        now = datetime.now(timezone.utc).timestamp()
+        start = (page - 1) * limit
+        records = [
+            {
+                "_id": f"stub-{index}",
+                "status": "DELIVERED",
+                "cost": self.config.cost_per_message,
+                "created_at": datetime.fromtimestamp(
+                    now - index * 60, timezone.utc
+                ).isoformat(),
+            }
+            for index in range(start, min(start + limit, total))
+        ]
+        return await self._async_respond(
+            request,
+            {
+                "data": records,
+                "total": total,
+                "last_page": max(1, -(-total // limit)),
+            },
+        )
+
+    async def async_start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start listening and return the base URL."""
+        app = web.Application()
+        app.router.add_post("/sms/send", self._async_send)
+        app.router.add_get("/api/balance", self._async_balance)
+        app.router.add_get("/v2/messages", self._async_messages)
+
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{bound_port}"
+        return self.base_url
+
+    async def async_stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -1,24 +1,92 @@
 """The SMS.to integration."""
 import logging
+from typing import Any
 
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HassJob,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.service import async_set_service_schema
-
-from .const import CONF_API_KEY, CONF_SENDER_ID, DOMAIN
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    CONF_API_KEY,
+    CONF_BALANCE_FLOOR,
+    CONF_BALANCE_FLOOR_ACTION,
+    CONF_COALESCE_WINDOW,
+    CONF_COST_PER_SEGMENT,
+    CONF_DEDUP_WINDOW,
+    CONF_DIGEST_MAX_SEGMENTS,
+    CONF_DIGEST_WINDOW,
+    CONF_QUOTA_ACTION,
+    CONF_QUOTA_PER_DAY,
+    CONF_QUOTA_PER_HOUR,
+    CONF_RATE_LIMIT,
+    CONF_RATE_LIMIT_BURST,
+    CONF_SENDER_ID,
+    DEDUP_CACHE_SIZE,
+    DEFAULT_BALANCE_FLOOR,
+    DEFAULT_BALANCE_FLOOR_ACTION,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_COST_PER_SEGMENT,
+    DEFAULT_DEDUP_WINDOW,
+    DEFAULT_DIGEST_MAX_SEGMENTS,
+    DEFAULT_DIGEST_WINDOW,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_QUOTA_ACTION,
+    DEFAULT_QUOTA_PER_DAY,
+    DEFAULT_QUOTA_PER_HOUR,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_LIMIT_BURST,
+    DOMAIN,
+    EVENT_MESSAGE_FAILED,
+    EVENT_MESSAGE_SENT,
+    FLOOR_ACTION_REFUSE,
+    LANE_BULK,
+    LANE_CRITICAL,
+    QUOTA_ACTION_DEFER,
+    QUOTA_ACTION_DIGEST,
+    QUOTA_ACTION_REJECT,
+    QUOTA_MAX_DEFERRED,
+    ROUTING_FAILOVER,
+    ROUTING_MODES,
+    SPOOL_RESPONSE_TIMEOUT,
+)
+from .account import account_id, async_get_account
+from .breaker import STATE_OPEN, SMSToCircuitBreaker
+from .coalesce import SMSToCoalescer
 from .coordinator import SMSToCoordinator
-from .notify import SMSToNotificationService
+from .dedup import SMSToDeduplicator
+from .digest import SMSToDigest
+from .encoding import analyze_message, estimate_cost
+from .ledger import SMSToLedger
+from .metrics import SMSToMetrics
+from .notify import SMSToNotificationService, compose_message
+from .phone import normalize_targets
+from .quota import SMSToQuota
+from .ratelimit import SMSToRateLimiter
+from .routing import SMSToRouter
+from .session import SMSToSession
+from .spool import SMSToSpool, priority_lane, result_for
+from .webhook import async_setup_webhook
 
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-PLATFORMS = ["sensor"]
+PLATFORMS = ["binary_sensor", "sensor"]
 
 NOTIFY_SMSTO_SCHEMA = vol.Schema(
     {
@@ -29,11 +97,31 @@ NOTIFY_SMSTO_SCHEMA = vol.Schema(
             {
                 vol.Optional("callback_url"): cv.url,
                 vol.Optional("priority"): cv.string,
+                vol.Optional("chunk_size"): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=1000)
+                ),
+                vol.Optional("max_concurrency"): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=20)
+                ),
+                vol.Optional("dry_run"): cv.boolean,
+                vol.Optional("dedup"): cv.boolean,
+                vol.Optional("blocking"): cv.boolean,
+                vol.Optional("digest"): cv.boolean,
+                vol.Optional("entry"): cv.string,
+                vol.Optional("routing"): vol.In(ROUTING_MODES),
             }
         ),
     }
 )
 
+ESTIMATE_SCHEMA = vol.Schema(
+    {
+        vol.Required("message"): cv.string,
+        vol.Optional("title"): cv.string,
+        vol.Optional("target"): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+
 # Schema for the Developer Tools UI (fields, descriptions, examples, selectors)
 SERVICE_SCHEMA_UI = {
     "name": "SMS.to Notification",
@@ -59,7 +147,7 @@ SERVICE_SCHEMA_UI = {
         },
         "data": {
             "description": "Platform-specific additional data.",
-            "example": {"callback_url": "https://example.com/callback"},
+            "example": {"callback_url": "https://example.com/callback", "dry_run": True},
             "required": False,
             "selector": {"object": {}},
         },
@@ -84,47 +172,348 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     _LOGGER.debug("API Key: %s****, Sender ID: %s", api_key[:4], sender_id)
 
-    # Shared aiohttp session
-    session = async_get_clientsession(hass)
+    # Dedicated connection pool, pre-connected in the background
+    session = SMSToSession(hass)
+    entry.async_on_unload(session.async_close)
+    entry.async_create_background_task(
+        hass, session.async_warm_up(), f"{DOMAIN} warm-up ({entry.entry_id})"
+    )
+
+    # Client-side rate limiter shared by every request of this entry
+    limiter = SMSToRateLimiter(
+        rate=entry.data.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+        burst=entry.data.get(CONF_RATE_LIMIT_BURST, DEFAULT_RATE_LIMIT_BURST),
+    )
+
+    # Create the API service; the circuit breaker fails fast during outages
+    breaker = SMSToCircuitBreaker()
+    metrics = SMSToMetrics()
+    service = SMSToNotificationService(
+        api_key, sender_id, session.session, limiter, breaker=breaker, metrics=metrics
+    )
+
+    # Share polling and the message history with entries using the same API key
+    account = async_get_account(hass, api_key)
+    history = await account.async_setup_history(service, entry.entry_id)
+
+    # Predict the balance locally between (rare) balance fetches
+    ledger = SMSToLedger(
+        cost_per_segment=entry.data.get(
+            CONF_COST_PER_SEGMENT, DEFAULT_COST_PER_SEGMENT
+        ),
+        floor=entry.data.get(CONF_BALANCE_FLOOR, DEFAULT_BALANCE_FLOOR),
+        floor_action=entry.data.get(
+            CONF_BALANCE_FLOOR_ACTION, DEFAULT_BALANCE_FLOOR_ACTION
+        ),
+        reserved=account.reserved,
+    )
+
+    # Create the coordinator and restore the values cached by the last run
+    coordinator = SMSToCoordinator(hass, entry.entry_id, service, account, ledger)
+    await coordinator.async_restore()
+    entry.async_on_unload(coordinator.async_shutdown)
+    entry.async_on_unload(account.async_add_member(coordinator))
+
+    cancel_half_open: CALLBACK_TYPE | None = None
+
+    @callback
+    def _async_breaker_changed() -> None:
+        """Publish the circuit breaker state to its binary sensor.
+
+        An open circuit turns half-open with time alone, so a timer publishes
+        that change at the end of the cooldown.
+        """
+        nonlocal cancel_half_open
+        if cancel_half_open is not None:
+            cancel_half_open()
+            cancel_half_open = None
+        if breaker.state == STATE_OPEN:
+            cancel_half_open = async_call_later(
+                hass, breaker.retry_in, _async_cooldown_over
+            )
+        coordinator.async_set_local_data({"circuit_breaker": breaker.attributes()})
+
+    @callback
+    def _async_cooldown_over(_now: Any) -> None:
+        """Publish the half-open state once the cooldown has elapsed."""
+        nonlocal cancel_half_open
+        cancel_half_open = None
+        _async_breaker_changed()
+
+    @callback
+    def _async_cancel_half_open() -> None:
+        """Cancel the cooldown timer when the entry is unloaded."""
+        if cancel_half_open is not None:
+            cancel_half_open()
+
+    breaker.on_change = _async_breaker_changed
+    _async_breaker_changed()
+    entry.async_on_unload(_async_cancel_half_open)
+
+    # Receive delivery reports on a webhook and inject its URL into sends
+    service.callback_url = async_setup_webhook(hass, entry, coordinator)
+    history.push_updates = service.callback_url is not None
+
+    # Restore the outbound spool and start its delivery workers
+    spool = SMSToSpool(hass, entry, service)
+
+    queued: set[str] = set()
+
+    @callback
+    def _async_on_queued(item: dict) -> None:
+        """Reserve the estimated cost of a queued message against the floor."""
+        text = compose_message(item["message"], item["title"])
+        ledger.reserve(item["id"], ledger.estimate(text, len(item["target"])))
+        queued.add(item["id"])
+
+    @callback
+    def _async_release_queued() -> None:
+        """Drop the reservations of messages left in the spool on unload."""
+        for message_id in queued:
+            ledger.release(message_id)
+
+    entry.async_on_unload(spool.async_add_queue_listener(_async_on_queued))
+    entry.async_on_unload(_async_release_queued)
+
+    @callback
+    def _async_on_settled(item: dict, result: dict) -> None:
+        """Charge a settled message to the ledgers and reconcile soon after."""
+        ledger.release(item["id"])
+        queued.discard(item["id"])
+        coordinator.async_set_local_data(metrics.sensor_values())
+        text = compose_message(item["message"], item["title"])
+        # Every entry of the account spends from the same balance
+        charged = False
+        for member in account.members:
+            if member.ledger.record(text, result):
+                member.async_set_local_data(member.ledger_data())
+                charged = True
+        if charged:
+            coordinator.async_schedule_reconcile()
+
+    entry.async_on_unload(spool.async_add_listener(_async_on_settled))
+
+    @callback
+    def _async_fire_completion(item: dict, result: dict) -> None:
+        """Announce the outcome of a settled message on the event bus."""
+        hass.bus.async_fire(
+            EVENT_MESSAGE_FAILED if result["status"] == "failed" else EVENT_MESSAGE_SENT,
+            {
+                "entry_id": entry.entry_id,
+                "message_id": next(iter(result["message_ids"]), None),
+                **result,
+            },
+        )
+
+    entry.async_on_unload(spool.async_add_listener(_async_fire_completion))
+    await spool.async_start()
+
+    # Drop repeats of the same alert within the dedup window
+    dedup = SMSToDeduplicator(
+        window=entry.data.get(CONF_DEDUP_WINDOW, DEFAULT_DEDUP_WINDOW),
+        max_size=DEDUP_CACHE_SIZE,
+    )
+    coordinator.async_set_local_data(
+        {"suppressed_duplicates": dedup.suppressed, "dedup": dedup.attributes()}
+    )
+
+    # Optionally merge identical messages sent within a few hundred ms
+    coalescer = SMSToCoalescer(
+        hass,
+        window=entry.data.get(CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW) / 1000,
+        submit=spool.async_enqueue,
+    )
+
+    # Per-recipient quotas against runaway automations
+    quota = SMSToQuota(
+        hass,
+        entry.entry_id,
+        per_hour=entry.data.get(CONF_QUOTA_PER_HOUR, DEFAULT_QUOTA_PER_HOUR),
+        per_day=entry.data.get(CONF_QUOTA_PER_DAY, DEFAULT_QUOTA_PER_DAY),
+    )
+    await quota.async_load()
+
+    @callback
+    def _async_submit_digest(**kwargs: Any) -> str:
+        """Queue a digest SMS, counted against its recipient's quota."""
+        delay = quota.async_reserve(kwargs["target"][0])
+        return spool.async_enqueue(**kwargs, delay=delay)
+
+    # Roll data.digest messages into one SMS per recipient
+    digest = SMSToDigest(
+        hass,
+        window=entry.data.get(CONF_DIGEST_WINDOW, DEFAULT_DIGEST_WINDOW) * 60,
+        max_segments=entry.data.get(
+            CONF_DIGEST_MAX_SEGMENTS, DEFAULT_DIGEST_MAX_SEGMENTS
+        ),
+        submit=_async_submit_digest,
+        hold=quota.retry_in,
+    )
 
-    # Create the API service
-    service = SMSToNotificationService(api_key, sender_id, session)
+    # Drain the spool in the first shutdown stage, before Home Assistant
+    # cancels the entry's background tasks (the spool workers)
+    async def _async_drain_on_stop() -> None:
+        """Hand buffered messages to the spool, then drain it."""
+        nonlocal unsub_stop
+        unsub_stop = None
+        coalescer.async_flush_all()
+        digest.async_flush_all()
+        await spool.async_stop()
 
-    # Create and run the coordinator
-    coordinator = SMSToCoordinator(hass, service)
-    await coordinator.async_config_entry_first_refresh()
+    unsub_stop = hass.async_add_shutdown_job(HassJob(_async_drain_on_stop))
+
+    @callback
+    def _async_remove_stop_listener() -> None:
+        """Drop the shutdown job when the entry is unloaded."""
+        if unsub_stop is not None:
+            unsub_stop()
+
+    entry.async_on_unload(_async_remove_stop_listener)
 
     # Store runtime data
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {
+        "entry": entry,
         "coordinator": coordinator,
+        "account": account,
         "service": service,
+        "spool": spool,
+        "dedup": dedup,
+        "coalescer": coalescer,
+        "digest": digest,
+        "quota": quota,
+        "ledger": ledger,
+        "limiter": limiter,
+        "breaker": breaker,
+        "metrics": metrics,
     }
 
-    # Register the notify.smsto service
-    _register_notify_service(hass, service)
+    # Register the notify.smsto and smsto.estimate services
+    _register_notify_service(hass)
+    _register_estimate_service(hass)
 
     # Forward platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # Refresh in the background so startup never waits on api.sms.to
+    entry.async_create_background_task(
+        hass,
+        coordinator.async_refresh(),
+        f"{DOMAIN} first refresh ({entry.entry_id})",
+    )
+
+    # Reload when settings change in the options flow
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     _LOGGER.info("SMS.to integration setup complete.")
     return True
 
 
-def _register_notify_service(
-    hass: HomeAssistant, service: SMSToNotificationService
-) -> None:
-    """Register the notify.smsto service if not already registered."""
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the entry so updated settings take effect."""
+    _LOGGER.debug("Settings updated — reloading SMS.to entry %s.", entry.entry_id)
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _estimate(
+    entry: ConfigEntry, message: str, title: str, target: list[str] | None
+) -> dict:
+    """Return the encoding, segments and estimated cost of a message."""
+    return estimate_cost(
+        analyze_message(compose_message(message, title)),
+        recipients=len(target or []),
+        cost_per_segment=entry.data.get(
+            CONF_COST_PER_SEGMENT, DEFAULT_COST_PER_SEGMENT
+        ),
+    )
+
+
+def _normalize_targets(hass: HomeAssistant, target: list[str]) -> list[str]:
+    """Return the recipients of a call in E.164 format, without duplicates.
+
+    National numbers are read in the country set in the Home Assistant
+    configuration. Invalid numbers are dropped before any API request.
+    """
+    valid, invalid = normalize_targets(target, hass.config.country)
+    if invalid:
+        _LOGGER.warning("Skipping invalid phone number(s): %s", ", ".join(invalid))
+    if not valid:
+        raise HomeAssistantError(
+            f"No valid phone number in target: {', '.join(invalid) or target}."
+        )
+    return valid
+
+
+@callback
+def _async_apply_quota(
+    entry_data: dict,
+    action: str,
+    message: str,
+    title: str,
+    target: list[str],
+    data: dict,
+    chunk_size: int,
+    max_concurrency: int,
+) -> list[str]:
+    """Count a message against its recipients' quotas; return those within quota.
+
+    Recipients over quota are dropped, deferred (held in the spool until
+    their quota has room, at most QUOTA_MAX_DEFERRED per recipient) or added
+    to their digest, depending on ``action``.
+    """
+    quota: SMSToQuota = entry_data["quota"]
+    allowed = [number for number in target if not quota.retry_in(number)]
+    over = [number for number in target if number not in allowed]
+
+    if over:
+        quota.exceeded += len(over)
+        _LOGGER.warning("SMS quota exceeded for %s — %s.", ", ".join(over), action)
+        if action == QUOTA_ACTION_DEFER:
+            for number in over:
+                if entry_data["spool"].held_for(number) >= QUOTA_MAX_DEFERRED:
+                    # A runaway automation must not grow the queue without end
+                    _LOGGER.warning(
+                        "SMS quota: %s already has %s deferred message(s) — "
+                        "dropping this one.",
+                        number,
+                        QUOTA_MAX_DEFERRED,
+                    )
+                    continue
+                entry_data["spool"].async_enqueue(
+                    message=message,
+                    title=title,
+                    target=[number],
+                    data=data,
+                    chunk_size=chunk_size,
+                    max_concurrency=max_concurrency,
+                    delay=quota.async_reserve(number),
+                )
+        elif action == QUOTA_ACTION_DIGEST:
+            entry_data["digest"].async_add(message, title, over, data)
+
+    for number in allowed:
+        quota.async_reserve(number)
+    return allowed
+
+
+def _register_notify_service(hass: HomeAssistant) -> None:
+    """Register the notify.smsto service if not already registered.
+
+    The service is shared by every loaded entry; each call is routed to one
+    of them by SMSToRouter.
+    """
     if hass.services.has_service("notify", "smsto"):
         _LOGGER.debug("notify.smsto service already registered — skipping.")
         return
 
-    async def async_handle_send(call: ServiceCall) -> None:
+    router = SMSToRouter(hass)
+
+    async def async_handle_send(call: ServiceCall) -> ServiceResponse:
         """Handle notify.smsto service calls."""
         message: str = call.data.get("message", "")
         title: str = call.data.get("title", "")
         target = call.data.get("target")
-        data: dict = call.data.get("data", {})
+        data: dict = dict(call.data.get("data", {}))
 
         if message == "TEST_MESSAGE":
             _LOGGER.info(
@@ -134,22 +523,148 @@ def _register_notify_service(
                 target,
                 data,
             )
-            return
+            return {"status": "skipped"} if call.return_response else None
 
         _LOGGER.debug(
             "notify.smsto called — message: %s, target: %s", message[:50], target
         )
-
-        try:
-            await service.async_send_message(
-                message=message, title=title, target=target, data=data
+        if target:
+            target = _normalize_targets(hass, target)
+
+        # Bulk-mode options are local only — never forwarded to the API
+        chunk_size: int = data.pop("chunk_size", DEFAULT_CHUNK_SIZE)
+        max_concurrency: int = data.pop("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        dry_run: bool = data.pop("dry_run", False)
+        use_dedup: bool = data.pop("dedup", True)
+        use_digest: bool = data.pop("digest", False)
+        blocking: bool = data.pop("blocking", True)
+        selector: str | None = data.pop("entry", None)
+        routing: str = data.pop("routing", ROUTING_FAILOVER)
+
+        # Pick the account; critical alerts are never held back by a balance floor
+        text = compose_message(message, title)
+        critical = priority_lane(data.get("priority")) == LANE_CRITICAL
+        entry_data = router.select(
+            selector,
+            routing,
+            text,
+            len(target or []),
+            check_floor=not critical,
+        )
+        entry: ConfigEntry = entry_data["entry"]
+        spool: SMSToSpool = entry_data["spool"]
+        dedup: SMSToDeduplicator = entry_data["dedup"]
+        coalescer: SMSToCoalescer = entry_data["coalescer"]
+
+        if dry_run:
+            estimate = _estimate(entry, message, title, target)
+            _LOGGER.info("Dry run — not sending. Estimate: %s", estimate)
+            return estimate if call.return_response else None
+
+        # Critical alerts are never suppressed; the window opens once accepted
+        dedup_target = target if use_dedup and target and not critical else None
+        if dedup_target and dedup.is_duplicate(dedup_target, title, message):
+            entry_data["coordinator"].async_set_local_data(
+                {"suppressed_duplicates": dedup.suppressed, "dedup": dedup.attributes()}
             )
+            return {"status": "suppressed"} if call.return_response else None
+
+        # Keep the predicted balance above the floor; critical alerts always go out
+        ledger: SMSToLedger = entry_data["ledger"]
+        if target and not critical:
+            cost = ledger.estimate(text, len(target))
+            if (action := ledger.check(cost)) == FLOOR_ACTION_REFUSE:
+                raise HomeAssistantError(
+                    "Sending this SMS would take the balance below the configured floor."
+                )
+            if action is not None:
+                # Only picks the spool lane; never sent to the API
+                data["priority"] = LANE_BULK
+
+        # Hold back recipients over their quota; critical alerts are exempt,
+        # and digested messages are counted when their digest is sent
+        quota: SMSToQuota = entry_data["quota"]
+        if target and not critical and not use_digest and quota.enabled:
+            quota_action = entry.data.get(CONF_QUOTA_ACTION, DEFAULT_QUOTA_ACTION)
+            target = _async_apply_quota(
+                entry_data,
+                quota_action,
+                message,
+                title,
+                target,
+                data,
+                chunk_size,
+                max_concurrency,
+            )
+            if not target:
+                if quota_action == QUOTA_ACTION_REJECT:
+                    raise HomeAssistantError("Every recipient is over its SMS quota.")
+                if dedup_target:
+                    dedup.record(dedup_target, title, message)
+                status = "deferred" if quota_action == QUOTA_ACTION_DEFER else "digested"
+                return {"status": status} if call.return_response else None
+
+        # Buffer digestible messages; critical alerts are never delayed
+        if use_digest and target and not critical:
+            try:
+                entry_data["service"].validate_send_args(target, data)
+            except Exception as err:
+                _LOGGER.error("Error queueing SMS notification: %s", err)
+                raise HomeAssistantError("Failed to queue SMS notification.") from err
+            entry_data["digest"].async_add(message, title, target, data)
+            if dedup_target:
+                dedup.record(dedup_target, title, message)
+            return {"status": "digested"} if call.return_response else None
+
+        # Persist and hand off to the spool — delivery happens in the background
+        try:
+            if coalescer.enabled:
+                # Validate first so one bad call cannot fail a shared batch
+                entry_data["service"].validate_send_args(target, data)
+                if dedup_target:
+                    dedup.record(dedup_target, title, message)
+                spool_id = await coalescer.async_submit(
+                    message=message,
+                    title=title,
+                    target=target,
+                    data=data,
+                    chunk_size=chunk_size,
+                    max_concurrency=max_concurrency,
+                )
+            else:
+                spool_id = spool.async_enqueue(
+                    message=message,
+                    title=title,
+                    target=target,
+                    data=data,
+                    chunk_size=chunk_size,
+                    max_concurrency=max_concurrency,
+                )
+                if dedup_target:
+                    dedup.record(dedup_target, title, message)
         except Exception as err:
-            _LOGGER.error("Error sending SMS notification: %s", err)
-            raise HomeAssistantError("Failed to send SMS notification.") from err
+            _LOGGER.error("Error queueing SMS notification: %s", err)
+            raise HomeAssistantError("Failed to queue SMS notification.") from err
+
+        if not call.return_response:
+            return None
+        if blocking:
+            # Wait for delivery so the caller gets message ids and outcomes
+            result = await spool.async_wait(spool_id, SPOOL_RESPONSE_TIMEOUT)
+            if coalescer.enabled:
+                # The spool entry is shared with other coalesced callers
+                result = result_for(result, target)
+        else:
+            # The outcome follows as an smsto_message_sent/_failed event
+            result = {"spool_id": spool_id, "status": "queued"}
+        return {**result, "sender_id": entry.data.get(CONF_SENDER_ID)}
 
     hass.services.async_register(
-        "notify", "smsto", async_handle_send, schema=NOTIFY_SMSTO_SCHEMA
+        "notify",
+        "smsto",
+        async_handle_send,
+        schema=NOTIFY_SMSTO_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
     # Set the UI schema so Developer Tools shows fields, descriptions, and examples
@@ -160,6 +675,32 @@ def _register_notify_service(
     _LOGGER.debug("notify.smsto service registered with UI schema.")
 
 
+def _register_estimate_service(hass: HomeAssistant) -> None:
+    """Register the smsto.estimate service if not already registered."""
+    if hass.services.has_service(DOMAIN, "estimate"):
+        return
+
+    async def async_handle_estimate(call: ServiceCall) -> ServiceResponse:
+        """Handle smsto.estimate service calls — no API request is made."""
+        # Priced with the first loaded entry's cost per segment
+        entry_data = next(iter(hass.data[DOMAIN].values()))
+        target = call.data.get("target")
+        return _estimate(
+            entry_data["entry"],
+            call.data["message"],
+            call.data.get("title", ""),
+            normalize_targets(target, hass.config.country)[0] if target else None,
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        "estimate",
+        async_handle_estimate,
+        schema=ESTIMATE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload an SMS.to config entry."""
     _LOGGER.debug("Unloading SMS.to integration (entry: %s).", entry.entry_id)
@@ -168,14 +709,42 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unloaded:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if entry_data:
+            # No new messages; drain requests in flight and persist the rest
+            entry_data["coalescer"].async_flush_all()
+            entry_data["digest"].async_flush_all()
+            await entry_data["spool"].async_stop()
+            # Write delayed saves now, so none lands after async_remove_entry
+            await entry_data["quota"].async_save()
+            account = entry_data["account"]
+            if account.members == [entry_data["coordinator"]]:
+                await account.history.async_save()
         _LOGGER.debug("Entry data removed for %s.", entry.entry_id)
 
-        # Remove the notify service only if no other entries remain
+        # Remove the services only if no other entries remain
         if not hass.data[DOMAIN]:
             if hass.services.has_service("notify", "smsto"):
                 hass.services.async_remove("notify", "smsto")
                 _LOGGER.debug("notify.smsto service removed.")
+            if hass.services.has_service(DOMAIN, "estimate"):
+                hass.services.async_remove(DOMAIN, "estimate")
 
     _LOGGER.info("SMS.to integration unload %s.", "complete" if unloaded else "failed")
     return unloaded
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the files a removed entry kept in .storage."""
+    for name in ("spool", "inflight", "cache", "quota"):
+        await Store(hass, 1, f"{DOMAIN}.{entry.entry_id}.{name}").async_remove()
+
+    # The message history belongs to the account; keep it while another
+    # entry still uses the same API key
+    api_key = entry.data[CONF_API_KEY]
+    if not any(
+        other.entry_id != entry.entry_id and other.data.get(CONF_API_KEY) == api_key
+        for other in hass.config_entries.async_entries(DOMAIN)
+    ):
+        await Store(hass, 1, f"{DOMAIN}.{account_id(api_key)}.history").async_remove()
+    _LOGGER.debug("Stored data removed for %s.", entry.entry_id)
@@ -0,0 +1,127 @@
+"""Account-level state shared by the entries of one SMS.to API key."""
+import asyncio
+import hashlib
+import logging
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DATA_ACCOUNTS
+from .history import SMSToMessageHistory
+from .notify import SMSToNotificationService
+
+if TYPE_CHECKING:
+    from .coordinator import SMSToCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def account_id(api_key: str) -> str:
+    """Return a stable identifier for an API key that does not reveal it."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:12]
+
+
+class SMSToAccount:
+    """Polling and message history shared by every entry of one API key.
+
+    Entries that differ only by sender ID see the same balance and the same
+    messages, so only one of them needs to ask. Concurrent fetches of an
+    endpoint join one request, and a fetched value is fanned out to every
+    member coordinator, which then skips that endpoint until its next
+    interval. Polling cost scales with accounts, not sender IDs.
+    """
+
+    def __init__(self, hass: HomeAssistant, account_id: str) -> None:
+        """Initialize the account."""
+        self._hass = hass
+        self.account_id = account_id
+        self.members: list[SMSToCoordinator] = []
+        self.history: SMSToMessageHistory | None = None
+        # Spool id → estimated cost of a message queued by any member
+        self.reserved: dict[str, float] = {}
+        self._history_lock = asyncio.Lock()
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+
+    async def async_setup_history(
+        self, service: SMSToNotificationService, entry_id: str
+    ) -> SMSToMessageHistory:
+        """Return the message history of the account, loading it once.
+
+        The per-entry history file of an older version of ``entry_id`` is
+        folded into it.
+        """
+        async with self._history_lock:
+            if self.history is None:
+                history = SMSToMessageHistory(self._hass, self.account_id, service)
+                await history.async_load()
+                self.history = history
+            await self.history.async_migrate(entry_id)
+        return self.history
+
+    @callback
+    def async_add_member(self, coordinator: "SMSToCoordinator") -> CALLBACK_TYPE:
+        """Fan account data out to ``coordinator``; return a callback to leave."""
+        self.members.append(coordinator)
+        _LOGGER.debug(
+            "Account %s: %s entr(y/ies) share polling.",
+            self.account_id,
+            len(self.members),
+        )
+
+        @callback
+        def _async_remove() -> None:
+            self.members.remove(coordinator)
+            if not self.members:
+                self._hass.data[DATA_ACCOUNTS].pop(self.account_id, None)
+            elif self.history is not None and self.history.service is coordinator.service:
+                # The leaving entry closes its session; sync through another one
+                self.history.service = self.members[0].service
+
+        return _async_remove
+
+    async def _async_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+        origin: "SMSToCoordinator",
+    ) -> dict[str, Any]:
+        """Fetch ``key`` once and hand the values to the other members."""
+        try:
+            values = await fetch()
+        finally:
+            self._inflight.pop(key, None)
+        for member in self.members:
+            if member is not origin:
+                member.async_receive(key, values)
+        return values
+
+    async def async_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[dict[str, Any]]],
+        origin: "SMSToCoordinator",
+    ) -> dict[str, Any]:
+        """Return the values of endpoint ``key``, joining a fetch in flight."""
+        if (task := self._inflight.get(key)) is None:
+            task = self._inflight[key] = self._hass.async_create_task(
+                self._async_fetch(key, fetch, origin),
+                f"{DATA_ACCOUNTS} {self.account_id} {key}",
+            )
+        return await asyncio.shield(task)
+
+    @callback
+    def async_set_local_data(self, values: dict[str, Any]) -> None:
+        """Push locally computed account values to every member."""
+        for member in self.members:
+            member.async_set_local_data(values)
+
+
+@callback
+def async_get_account(hass: HomeAssistant, api_key: str) -> SMSToAccount:
+    """Return the shared account of ``api_key``, creating it if needed."""
+    accounts: dict[str, SMSToAccount] = hass.data.setdefault(DATA_ACCOUNTS, {})
+    key = account_id(api_key)
+    if (account := accounts.get(key)) is None:
+        account = accounts[key] = SMSToAccount(hass, key)
+    return account
@@ -0,0 +1,80 @@
+"""Binary sensor platform for SMS.to."""
+import logging
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .breaker import STATE_CLOSED
+from .const import DOMAIN
+from .coordinator import SMSToCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+CIRCUIT_BREAKER_DESCRIPTION = BinarySensorEntityDescription(
+    key="circuit_breaker",
+    translation_key="circuit_breaker",
+    icon="mdi:electric-switch",
+    device_class=BinarySensorDeviceClass.PROBLEM,
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up SMS.to binary sensors from a config entry."""
+    coordinator: SMSToCoordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    async_add_entities([SMSToCircuitBreakerSensor(coordinator, entry)])
+
+
+class SMSToCircuitBreakerSensor(CoordinatorEntity[SMSToCoordinator], BinarySensorEntity):
+    """On while the circuit breaker keeps requests away from the SMS.to API."""
+
+    entity_description = CIRCUIT_BREAKER_DESCRIPTION
+    has_entity_name = True
+
+    def __init__(self, coordinator: SMSToCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator)
+        self._attr_unique_id = f"{entry.entry_id}_{self.entity_description.key}"
+
+    @property
+    def available(self) -> bool:
+        """Return True — the breaker state is local and always known."""
+        return True
+
+    @property
+    def _breaker(self) -> dict[str, Any]:
+        """Return the breaker attributes from coordinator data."""
+        return (self.coordinator.data or {}).get("circuit_breaker") or {}
+
+    @property
+    def is_on(self) -> bool:
+        """Return True if the circuit is open or half-open."""
+        return self._breaker.get("state", STATE_CLOSED) != STATE_CLOSED
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the breaker state, failure ratio and last error."""
+        return self._breaker or None
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device info for grouping entities."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, "smsto")},
+            name="SMS Notifications via SMS.to",
+            manufacturer="SMS.to",
+            model="SMS Notifications via SMS.to",
+            entry_type=DeviceEntryType.SERVICE,
+        )
@@ -0,0 +1,159 @@
+"""Circuit breaker for the SMS.to API client."""
+import logging
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from .const import (
+    BREAKER_FAILURE_RATIO,
+    BREAKER_MAX_OPEN_SECONDS,
+    BREAKER_MIN_CALLS,
+    BREAKER_OPEN_SECONDS,
+    BREAKER_SLOW_CALL_SECONDS,
+    BREAKER_WINDOW,
+)
+from .exceptions import SMSToCircuitOpenError
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+
+class SMSToCircuitBreaker:
+    """Stop calling SMS.to while it is failing or too slow.
+
+    The outcome of the last ``window`` requests is kept; a request counts
+    as failed on a network error, a timeout, a 5xx response or when it
+    takes longer than ``slow_call`` seconds. Once at least ``min_calls``
+    are recorded and the failed share reaches ``failure_ratio``, the
+    circuit opens and requests fail fast. After ``open_seconds`` one probe
+    request is let through (half-open): success closes the circuit, failure
+    opens it again for twice as long, up to ``max_open_seconds``.
+    """
+
+    def __init__(
+        self,
+        window: int = BREAKER_WINDOW,
+        min_calls: int = BREAKER_MIN_CALLS,
+        failure_ratio: float = BREAKER_FAILURE_RATIO,
+        slow_call: float = BREAKER_SLOW_CALL_SECONDS,
+        open_seconds: float = BREAKER_OPEN_SECONDS,
+        max_open_seconds: float = BREAKER_MAX_OPEN_SECONDS,
+    ) -> None:
+        """Initialize a closed breaker."""
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._min_calls = min_calls
+        self._failure_ratio = failure_ratio
+        self._slow_call = slow_call
+        self._base_open_seconds = open_seconds
+        self._max_open_seconds = max_open_seconds
+        self._open_seconds = open_seconds
+        self._opened_at: float | None = None
+        self._probing = False
+        self.trips = 0
+        self.last_error: str | None = None
+        # Called on every state change (e.g. to update an entity)
+        self.on_change: Callable[[], None] | None = None
+
+    @property
+    def state(self) -> str:
+        """Return the current state of the circuit."""
+        if self._opened_at is None:
+            return STATE_CLOSED
+        if time.monotonic() - self._opened_at < self._open_seconds:
+            return STATE_OPEN
+        return STATE_HALF_OPEN
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds until the next probe is allowed (0 if now)."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._open_seconds - time.monotonic())
+
+    def before_request(self) -> None:
+        """Raise SMSToCircuitOpenError unless a request may be made now."""
+        state = self.state
+        if state == STATE_CLOSED:
+            return
+        if state == STATE_HALF_OPEN and not self._probing:
+            self._probing = True
+            _LOGGER.debug("Circuit breaker: half-open — letting one probe through.")
+            return
+        raise SMSToCircuitOpenError(
+            f"SMS.to API unavailable (circuit open, retry in {self.retry_in:.0f}s): "
+            f"{self.last_error}"
+        )
+
+    def record(self, latency: float, error: str | None = None) -> None:
+        """Record the outcome of a request that was let through."""
+        if error is None and latency > self._slow_call:
+            error = f"slow response ({latency:.1f}s)"
+
+        if self._probing:
+            self._probing = False
+            if error is None:
+                self._close()
+            else:
+                self.last_error = error
+                self._open(min(self._open_seconds * 2, self._max_open_seconds))
+            return
+
+        self._outcomes.append(error is None)
+        if error is None:
+            return
+
+        self.last_error = error
+        failures = self._outcomes.count(False)
+        if (
+            self._opened_at is None
+            and len(self._outcomes) >= self._min_calls
+            and failures / len(self._outcomes) >= self._failure_ratio
+        ):
+            self._open(self._base_open_seconds)
+
+    def abort(self) -> None:
+        """Forget a request that ended without an outcome (e.g. cancelled)."""
+        self._probing = False
+
+    def _open(self, seconds: float) -> None:
+        """Open the circuit for ``seconds``."""
+        if self._opened_at is None:
+            self.trips += 1
+        self._opened_at = time.monotonic()
+        self._open_seconds = seconds
+        _LOGGER.warning(
+            "Circuit breaker: SMS.to API failing (%s) — pausing requests for %.0fs.",
+            self.last_error,
+            seconds,
+        )
+        self._notify()
+
+    def _close(self) -> None:
+        """Close the circuit and forget past failures."""
+        self._opened_at = None
+        self._open_seconds = self._base_open_seconds
+        self._outcomes.clear()
+        _LOGGER.info("Circuit breaker: SMS.to API recovered — circuit closed.")
+        self._notify()
+
+    def _notify(self) -> None:
+        """Invoke the state-change callback, if any."""
+        if self.on_change is not None:
+            self.on_change()
+
+    def attributes(self) -> dict[str, Any]:
+        """Return the breaker state as entity attributes."""
+        failures = self._outcomes.count(False)
+        return {
+            "state": self.state,
+            "failure_ratio": (
+                round(failures / len(self._outcomes), 2) if self._outcomes else 0.0
+            ),
+            "retry_in": round(self.retry_in),
+            "trips": self.trips,
+            "last_error": self.last_error,
+        }
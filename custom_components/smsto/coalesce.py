@@ -0,0 +1,119 @@
+"""Micro-batching of concurrent notify calls for the SMS.to integration."""
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .notify import compose_message
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class _Batch:
+    """Calls with the same message body waiting to be merged."""
+
+    message: str
+    data: dict[str, Any]
+    chunk_size: int
+    max_concurrency: int
+    future: asyncio.Future[str]
+    targets: dict[str, None] = field(default_factory=dict)
+    callers: int = 0
+    handle: asyncio.TimerHandle | None = None
+
+
+class SMSToCoalescer:
+    """Merge calls with an identical body that arrive within a short window.
+
+    The first call opens a batch and a timer of ``window`` seconds; later
+    calls with the same text and options only add their targets. When the
+    timer fires, the union of targets is submitted once and every caller
+    receives the id of that shared submission.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        window: float,
+        submit: Callable[..., str],
+    ) -> None:
+        """Initialize the coalescer."""
+        self._hass = hass
+        self._window = window
+        self._submit = submit
+        self._batches: dict[str, _Batch] = {}
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if coalescing is active."""
+        return self._window > 0
+
+    async def async_submit(
+        self,
+        message: str,
+        title: str,
+        target: list[str],
+        data: dict[str, Any],
+        chunk_size: int,
+        max_concurrency: int,
+    ) -> str:
+        """Join (or open) the batch for this body and wait for its submission."""
+        text = compose_message(message, title)
+        key = json.dumps(
+            [text, data, chunk_size, max_concurrency], sort_keys=True, default=str
+        )
+
+        if (batch := self._batches.get(key)) is None:
+            batch = _Batch(
+                message=text,
+                data=data,
+                chunk_size=chunk_size,
+                max_concurrency=max_concurrency,
+                future=self._hass.loop.create_future(),
+            )
+            batch.handle = self._hass.loop.call_later(self._window, self._flush, key)
+            self._batches[key] = batch
+
+        batch.targets.update(dict.fromkeys(target))
+        batch.callers += 1
+        # Shield so one cancelled caller does not cancel the shared result
+        return await asyncio.shield(batch.future)
+
+    @callback
+    def _flush(self, key: str) -> None:
+        """Submit a batch as a single message to the union of its targets."""
+        batch = self._batches.pop(key)
+        if batch.handle is not None:
+            batch.handle.cancel()
+
+        try:
+            result = self._submit(
+                message=batch.message,
+                title="",
+                target=list(batch.targets),
+                data=batch.data,
+                chunk_size=batch.chunk_size,
+                max_concurrency=batch.max_concurrency,
+            )
+        except Exception as err:  # handed to every waiting caller
+            batch.future.set_exception(err)
+            return
+
+        if batch.callers > 1:
+            _LOGGER.debug(
+                "Coalesced %s calls into one request for %s target(s).",
+                batch.callers,
+                len(batch.targets),
+            )
+        batch.future.set_result(result)
+
+    @callback
+    def async_flush_all(self) -> None:
+        """Submit every open batch immediately (e.g. before unloading)."""
+        for key in list(self._batches):
+            self._flush(key)
@@ -6,7 +6,38 @@ import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import CONF_API_KEY, CONF_SENDER_ID, DOMAIN
+from .const import (
+    CONF_API_KEY,
+    CONF_BALANCE_FLOOR,
+    CONF_BALANCE_FLOOR_ACTION,
+    CONF_COALESCE_WINDOW,
+    CONF_COST_PER_SEGMENT,
+    CONF_DEDUP_WINDOW,
+    CONF_DIGEST_MAX_SEGMENTS,
+    CONF_DIGEST_WINDOW,
+    CONF_QUOTA_ACTION,
+    CONF_QUOTA_PER_DAY,
+    CONF_QUOTA_PER_HOUR,
+    CONF_RATE_LIMIT,
+    CONF_RATE_LIMIT_BURST,
+    CONF_SENDER_ID,
+    DEFAULT_BALANCE_FLOOR,
+    DEFAULT_BALANCE_FLOOR_ACTION,
+    DEFAULT_COALESCE_WINDOW,
+    DEFAULT_COST_PER_SEGMENT,
+    DEFAULT_DEDUP_WINDOW,
+    DEFAULT_DIGEST_MAX_SEGMENTS,
+    DEFAULT_DIGEST_WINDOW,
+    DEFAULT_QUOTA_ACTION,
+    DEFAULT_QUOTA_PER_DAY,
+    DEFAULT_QUOTA_PER_HOUR,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_LIMIT_BURST,
+    DOMAIN,
+    FLOOR_ACTION_DEMOTE,
+    FLOOR_ACTION_REFUSE,
+    QUOTA_ACTIONS,
+)
 from .notify import SMSToNotificationService
 
 _LOGGER = logging.getLogger(__name__)
@@ -119,7 +150,7 @@ class SmstoOptionsFlowHandler(config_entries.OptionsFlow):
             # Update the config entry data and title
             self.hass.config_entries.async_update_entry(
                 self.config_entry,
-                data=user_input,
+                data={**self.config_entry.data, **user_input},
                 title=f"SMS.to ({user_input[CONF_SENDER_ID]})",
             )
 
@@ -135,6 +166,66 @@ class SmstoOptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Required(
                     CONF_SENDER_ID, default=current_data.get(CONF_SENDER_ID, "")
                 ): str,
+                vol.Optional(
+                    CONF_RATE_LIMIT,
+                    default=current_data.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0.1, max=100)),
+                vol.Optional(
+                    CONF_RATE_LIMIT_BURST,
+                    default=current_data.get(
+                        CONF_RATE_LIMIT_BURST, DEFAULT_RATE_LIMIT_BURST
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=500)),
+                vol.Optional(
+                    CONF_COST_PER_SEGMENT,
+                    default=current_data.get(
+                        CONF_COST_PER_SEGMENT, DEFAULT_COST_PER_SEGMENT
+                    ),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_DEDUP_WINDOW,
+                    default=current_data.get(CONF_DEDUP_WINDOW, DEFAULT_DEDUP_WINDOW),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=86400)),
+                vol.Optional(
+                    CONF_COALESCE_WINDOW,
+                    default=current_data.get(
+                        CONF_COALESCE_WINDOW, DEFAULT_COALESCE_WINDOW
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+                vol.Optional(
+                    CONF_DIGEST_WINDOW,
+                    default=current_data.get(CONF_DIGEST_WINDOW, DEFAULT_DIGEST_WINDOW),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=1440)),
+                vol.Optional(
+                    CONF_DIGEST_MAX_SEGMENTS,
+                    default=current_data.get(
+                        CONF_DIGEST_MAX_SEGMENTS, DEFAULT_DIGEST_MAX_SEGMENTS
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10)),
+                vol.Optional(
+                    CONF_BALANCE_FLOOR,
+                    default=current_data.get(CONF_BALANCE_FLOOR, DEFAULT_BALANCE_FLOOR),
+                ): vol.All(vol.Coerce(float), vol.Range(min=0)),
+                vol.Optional(
+                    CONF_BALANCE_FLOOR_ACTION,
+                    default=current_data.get(
+                        CONF_BALANCE_FLOOR_ACTION, DEFAULT_BALANCE_FLOOR_ACTION
+                    ),
+                ): vol.In([FLOOR_ACTION_DEMOTE, FLOOR_ACTION_REFUSE]),
+                vol.Optional(
+                    CONF_QUOTA_PER_HOUR,
+                    default=current_data.get(
+                        CONF_QUOTA_PER_HOUR, DEFAULT_QUOTA_PER_HOUR
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=1000)),
+                vol.Optional(
+                    CONF_QUOTA_PER_DAY,
+                    default=current_data.get(CONF_QUOTA_PER_DAY, DEFAULT_QUOTA_PER_DAY),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0, max=10000)),
+                vol.Optional(
+                    CONF_QUOTA_ACTION,
+                    default=current_data.get(CONF_QUOTA_ACTION, DEFAULT_QUOTA_ACTION),
+                ): vol.In(QUOTA_ACTIONS),
             }
         )
         return self.async_show_form(step_id="init", data_schema=options_schema)
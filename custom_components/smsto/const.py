@@ -1,6 +1,8 @@
 """Constants for the SMS.to integration."""
 
 DOMAIN = "smsto"
+# hass.data key of the accounts shared by entries with the same API key
+DATA_ACCOUNTS = f"{DOMAIN}_accounts"
 
 CONF_API_KEY = "api_key"
 CONF_SENDER_ID = "sender_id"
@@ -10,7 +12,150 @@ API_URL_BALANCE = "https://auth.sms.to/api/balance"
 API_URL_MESSAGES = "https://api.sms.to/v2/messages"
 
 DEFAULT_TIMEOUT = 10
-UPDATE_INTERVAL_MINUTES = 5
+
+# Integration-owned connection pool (see session.py)
+SESSION_LIMIT_PER_HOST = 8
+SESSION_DNS_CACHE_SECONDS = 600
+SESSION_KEEPALIVE_SECONDS = 60
+SESSION_WARMUP_TIMEOUT = 5
+
+# Per-endpoint polling intervals; the coordinator ticks at the shortest one.
+# Between balance fetches the ledger predicts the balance locally.
+BALANCE_INTERVAL_MINUTES = 60
+BALANCE_RECONCILE_DELAY = 120
+MESSAGES_INTERVAL_MINUTES = 15
+POLL_DUE_TOLERANCE_SECONDS = 5
+CACHE_SAVE_DELAY = 10
+
+# Incremental message-history sync (local index of /v2/messages)
+HISTORY_PROBE_SIZE = 10
+HISTORY_PAGE_SIZE = 100
+HISTORY_MAX_PAGES = 20
+HISTORY_RETENTION_DAYS = 30
+HISTORY_STATS_WINDOW_HOURS = 24
+HISTORY_SAVE_DELAY = 10
+HISTORY_FAILED_STATUSES = ("FAILED", "REJECTED", "UNDELIVERED", "EXPIRED")
+HISTORY_FINAL_STATUSES = ("DELIVERED", *HISTORY_FAILED_STATUSES)
+
+# Delivery reports pushed by SMS.to to a Home Assistant webhook
+CONF_WEBHOOK_ID = "webhook_id"
+EVENT_DELIVERY_REPORT = f"{DOMAIN}_delivery_report"
+
+# Fired when the spool settles a message (see data.blocking)
+EVENT_MESSAGE_SENT = f"{DOMAIN}_message_sent"
+EVENT_MESSAGE_FAILED = f"{DOMAIN}_message_failed"
+
+# Pre-send cost estimation (price of one SMS segment, in account currency)
+CONF_COST_PER_SEGMENT = "cost_per_segment"
+DEFAULT_COST_PER_SEGMENT = 0.05
+
+# Balance floor enforced by the local ledger (0 = off)
+CONF_BALANCE_FLOOR = "balance_floor"
+CONF_BALANCE_FLOOR_ACTION = "balance_floor_action"
+DEFAULT_BALANCE_FLOOR = 0.0
+FLOOR_ACTION_DEMOTE = "demote"
+FLOOR_ACTION_REFUSE = "refuse"
+DEFAULT_BALANCE_FLOOR_ACTION = FLOOR_ACTION_DEMOTE
+
+# Alert-storm deduplication (identical target + title + message)
+CONF_DEDUP_WINDOW = "dedup_window"
+DEFAULT_DEDUP_WINDOW = 0
+DEDUP_CACHE_SIZE = 256
+
+# Opt-in micro-batching of identical messages (window in milliseconds, 0 = off)
+CONF_COALESCE_WINDOW = "coalesce_window"
+DEFAULT_COALESCE_WINDOW = 0
+
+# Phone numbers: default country from the HA config, memoized parse results
+PHONE_CACHE_SIZE = 1024
+
+# Per-recipient quotas (0 = unlimited), counted in buckets of QUOTA_BUCKET_SECONDS
+CONF_QUOTA_PER_HOUR = "quota_per_hour"
+CONF_QUOTA_PER_DAY = "quota_per_day"
+CONF_QUOTA_ACTION = "quota_action"
+DEFAULT_QUOTA_PER_HOUR = 0
+DEFAULT_QUOTA_PER_DAY = 0
+QUOTA_ACTION_REJECT = "reject"
+QUOTA_ACTION_DEFER = "defer"
+QUOTA_ACTION_DIGEST = "digest"
+QUOTA_ACTIONS = (QUOTA_ACTION_REJECT, QUOTA_ACTION_DEFER, QUOTA_ACTION_DIGEST)
+DEFAULT_QUOTA_ACTION = QUOTA_ACTION_REJECT
+QUOTA_BUCKET_SECONDS = 300
+QUOTA_SAVE_DELAY = 30
+# Deferred messages held in the spool per recipient; more are dropped
+QUOTA_MAX_DEFERRED = 10
+
+# Digest mode: data.digest messages are merged per recipient over a window
+CONF_DIGEST_WINDOW = "digest_window"
+CONF_DIGEST_MAX_SEGMENTS = "digest_max_segments"
+DEFAULT_DIGEST_WINDOW = 15
+DEFAULT_DIGEST_MAX_SEGMENTS = 1
+
+# Bulk sends: targets are split into chunks sent concurrently
+DEFAULT_CHUNK_SIZE = 100
+DEFAULT_MAX_CONCURRENCY = 4
+
+# Priority lanes of the outbound spool, selected by data.priority
+LANE_CRITICAL = "critical"
+LANE_NORMAL = "normal"
+LANE_BULK = "bulk"
+LANES = (LANE_CRITICAL, LANE_NORMAL, LANE_BULK)
+PRIORITY_LANES = {
+    "critical": LANE_CRITICAL,
+    "emergency": LANE_CRITICAL,
+    "urgent": LANE_CRITICAL,
+    "high": LANE_CRITICAL,
+    "normal": LANE_NORMAL,
+    "medium": LANE_NORMAL,
+    "low": LANE_BULK,
+    "bulk": LANE_BULK,
+    "digest": LANE_BULK,
+}
+
+# Routing of notify.smsto across config entries (accounts / sender IDs)
+ROUTING_FAILOVER = "failover"
+ROUTING_ROUND_ROBIN = "round_robin"
+ROUTING_MODES = (ROUTING_FAILOVER, ROUTING_ROUND_ROBIN)
+
+# Client-side rate limiting (token bucket, adapts to 429 / Retry-After)
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RATE_LIMIT_BURST = "rate_limit_burst"
+DEFAULT_RATE_LIMIT = 5.0
+DEFAULT_RATE_LIMIT_BURST = 10
+RATE_LIMIT_MIN_RATE = 0.1
+RATE_LIMIT_RECOVERY_FACTOR = 0.05
+RATE_LIMIT_MAX_RETRIES = 3
+RATE_LIMIT_MAX_INLINE_WAIT = 30
+
+# Inline retries of transient API failures (exponential backoff + jitter)
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 5
+IDEMPOTENCY_CACHE_SIZE = 1024
+
+# Circuit breaker around the API client (error rate and latency driven)
+BREAKER_WINDOW = 20
+BREAKER_MIN_CALLS = 5
+BREAKER_FAILURE_RATIO = 0.5
+BREAKER_SLOW_CALL_SECONDS = 5
+BREAKER_OPEN_SECONDS = 30
+BREAKER_MAX_OPEN_SECONDS = 600
+
+# Request instrumentation (latency histogram bounds in ms, recent samples kept)
+METRICS_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)
+METRICS_SAMPLE_SIZE = 200
+
+# Outbound spool: persisted queue drained by background workers
+SPOOL_WORKERS = 2
+SPOOL_CRITICAL_WORKERS = 1
+SPOOL_SAVE_DELAY = 1
+SPOOL_MAX_ATTEMPTS = 8
+SPOOL_RETRY_BASE_SECONDS = 5
+SPOOL_RETRY_MAX_SECONDS = 600
+SPOOL_RESPONSE_TIMEOUT = 60
+SPOOL_RESULT_CACHE_SIZE = 256
+# Seconds requests in flight may take to finish on unload or shutdown
+SPOOL_DRAIN_TIMEOUT = 15
 
 ERROR_MESSAGES = {
     400: "Bad request. Please check your payload.",
@@ -1,59 +1,284 @@
 """DataUpdateCoordinator for the SMS.to integration."""
+import asyncio
 import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
 from datetime import timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DOMAIN, UPDATE_INTERVAL_MINUTES
+from .const import (
+    BALANCE_INTERVAL_MINUTES,
+    BALANCE_RECONCILE_DELAY,
+    CACHE_SAVE_DELAY,
+    DOMAIN,
+    MESSAGES_INTERVAL_MINUTES,
+    POLL_DUE_TOLERANCE_SECONDS,
+)
+from .account import SMSToAccount
+from .ledger import SMSToLedger
 from .notify import SMSToNotificationService
 
 _LOGGER = logging.getLogger(__name__)
 
+STORAGE_VERSION = 1
+
+
+@dataclass
+class SMSToEndpoint:
+    """Polling schedule and failure state of one API endpoint."""
+
+    key: str
+    interval: timedelta
+    fetch: Callable[[], Awaitable[dict[str, Any]]]
+    data_keys: tuple[str, ...]
+    last_attempt: float | None = None
+    last_success: float | None = None
+    failures: int = 0
+    last_error: str | None = None
+
+    def is_due(self, now: float) -> bool:
+        """Return True if the endpoint should be fetched on this tick.
+
+        Failed endpoints are retried on every tick until they recover.
+        """
+        if self.last_attempt is None or self.failures:
+            return True
+        elapsed = now - self.last_attempt
+        return elapsed >= self.interval.total_seconds() - POLL_DUE_TOLERANCE_SECONDS
+
+    def record_success(self) -> None:
+        """Clear the failure state after a successful fetch."""
+        self.failures = 0
+        self.last_error = None
+        self.last_success = time.time()
+
 
 class SMSToCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Coordinator to fetch SMS.to account data (balance + total messages)."""
+    """Coordinator to fetch SMS.to account data (balance + message history).
+
+    Each endpoint has its own interval and failure state. Due endpoints are
+    fetched concurrently on every tick, and an endpoint that fails keeps
+    its last good value without holding back the others.
+
+    The last polled values are cached on disk, so after a restart sensors
+    can show them immediately while the first refresh runs in the
+    background.
+
+    The balance is fetched rarely: between fetches the ledger predicts it
+    from the cost of each send, and a send schedules one reconciling fetch.
+
+    Fetches go through the shared SMSToAccount, so entries with the same API
+    key poll once and receive each other's values via async_receive.
+    """
 
     def __init__(
-        self, hass: HomeAssistant, service: SMSToNotificationService
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        service: SMSToNotificationService,
+        account: SMSToAccount,
+        ledger: SMSToLedger,
     ) -> None:
         """Initialize the coordinator."""
+        self.service = service
+        self.account = account
+        self._reconcile_unsub: CALLBACK_TYPE | None = None
+        self.ledger = ledger
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.cache"
+        )
+        self.history = account.history
+        self.endpoints: dict[str, SMSToEndpoint] = {
+            "balance": SMSToEndpoint(
+                key="balance",
+                interval=timedelta(minutes=BALANCE_INTERVAL_MINUTES),
+                fetch=self._async_fetch_balance,
+                data_keys=("balance",),
+            ),
+            "messages": SMSToEndpoint(
+                key="messages",
+                interval=timedelta(minutes=MESSAGES_INTERVAL_MINUTES),
+                fetch=self.history.async_sync,
+                data_keys=(
+                    "total_messages",
+                    "sent_today",
+                    "failed_24h",
+                    "delivery_rate",
+                ),
+            ),
+        }
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(minutes=UPDATE_INTERVAL_MINUTES),
+            # Tick at the shortest interval; slower endpoints skip ticks
+            update_interval=min(e.interval for e in self.endpoints.values()),
         )
-        self._service = service
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch balance and total messages from SMS.to API."""
-        _LOGGER.debug("Coordinator: fetching SMS.to account data.")
+    async def _async_fetch_balance(self) -> dict[str, Any]:
+        """Fetch the account balance."""
+        balance = await self.service.async_get_balance()
+        return {"balance": round(balance, 2) if balance is not None else None}
 
-        data: dict[str, Any] = {
-            "balance": None,
-            "total_messages": None,
+    @callback
+    def _apply(self, key: str, values: dict[str, Any]) -> dict[str, Any]:
+        """Turn the account values of endpoint ``key`` into this entry's data."""
+        if key != "balance":
+            return values
+        # Each entry keeps its own ledger (and balance floor)
+        self.ledger.reconcile(values["balance"])
+        return self.ledger_data()
+
+    @callback
+    def async_receive(self, key: str, values: dict[str, Any]) -> None:
+        """Take the values of endpoint ``key`` just fetched by another entry."""
+        endpoint = self.endpoints[key]
+        endpoint.last_attempt = time.monotonic()
+        endpoint.record_success()
+        self.async_set_local_data(self._apply(key, values))
+        self._store.async_delay_save(self._cache_to_save, CACHE_SAVE_DELAY)
+
+    @callback
+    def ledger_data(self) -> dict[str, Any]:
+        """Return the (predicted) balance and the ledger state."""
+        balance = self.ledger.balance
+        return {
+            "balance": round(balance, 2) if balance is not None else None,
+            "ledger": self.ledger.attributes(),
         }
 
-        # Fetch balance
-        try:
-            balance = await self._service.async_get_balance()
-            data["balance"] = round(balance, 2) if balance is not None else None
-            _LOGGER.debug("Coordinator: balance = %s", data["balance"])
-        except Exception as err:
-            _LOGGER.error("Coordinator: failed to fetch balance — %s", err)
-            raise UpdateFailed(f"Failed to fetch balance: {err}") from err
+    @callback
+    def async_schedule_reconcile(self) -> None:
+        """Fetch the real balance shortly after a send, once per burst of sends."""
+        if self._reconcile_unsub is not None:
+            return
+
+        async def _async_reconcile(_now: Any) -> None:
+            self._reconcile_unsub = None
+            self.endpoints["balance"].last_attempt = None
+            await self.async_refresh()
 
-        # Fetch total messages
+        self._reconcile_unsub = async_call_later(
+            self.hass, BALANCE_RECONCILE_DELAY, _async_reconcile
+        )
+
+    async def async_shutdown(self) -> None:
+        """Cancel a pending reconcile, stop polling and write the cache."""
+        if self._reconcile_unsub is not None:
+            self._reconcile_unsub()
+            self._reconcile_unsub = None
+        await super().async_shutdown()
+        # Also cancels a delayed write that could outlive a removed entry
+        await self._store.async_save(self._cache_to_save())
+
+    async def async_restore(self) -> bool:
+        """Load the cached values of the last run; return True if any were found."""
+        stored = await self._store.async_load()
+        if not stored:
+            return False
+
+        self.data = {**stored.get("data", {}), **(self.data or {})}
+        for key, last_success in stored.get("refreshed", {}).items():
+            if key in self.endpoints:
+                self.endpoints[key].last_success = last_success
+
+        if (balance := self.data.get("balance")) is not None:
+            self.ledger.reconcile(balance, self.endpoints["balance"].last_success)
+            self.data.update(self.ledger_data())
+
+        _LOGGER.debug("Coordinator: restored cached data — %s", self.data)
+        return True
+
+    @callback
+    def _cache_to_save(self) -> dict[str, Any]:
+        """Return the polled values to cache on disk."""
+        return {
+            "data": {
+                key: (self.data or {}).get(key)
+                for endpoint in self.endpoints.values()
+                for key in endpoint.data_keys
+            },
+            "refreshed": {
+                key: endpoint.last_success for key, endpoint in self.endpoints.items()
+            },
+        }
+
+    def endpoint_for(self, data_key: str) -> SMSToEndpoint | None:
+        """Return the endpoint that provides ``data_key``."""
+        for endpoint in self.endpoints.values():
+            if data_key in endpoint.data_keys:
+                return endpoint
+        return None
+
+    @callback
+    def async_set_local_data(self, values: dict[str, Any]) -> None:
+        """Merge locally computed values and notify listeners without polling."""
+        if self.data is None:
+            self.data = {}
+        self.data.update(values)
+        self.async_update_listeners()
+
+    async def _async_update_endpoint(
+        self, endpoint: SMSToEndpoint, fetched: dict[str, Any], now: float
+    ) -> None:
+        """Fetch one endpoint and record its outcome."""
+        endpoint.last_attempt = now
         try:
-            total = await self._service.async_get_total_messages()
-            data["total_messages"] = total
-            _LOGGER.debug("Coordinator: total_messages = %s", data["total_messages"])
+            values = await self.account.async_fetch(endpoint.key, endpoint.fetch, self)
         except Exception as err:
-            _LOGGER.error("Coordinator: failed to fetch total messages — %s", err)
-            # Don't raise here — we already have balance data.
-            # Just log the error; total_messages stays None.
+            endpoint.failures += 1
+            endpoint.last_error = str(err)
+            _LOGGER.error(
+                "Coordinator: failed to fetch %s (failure #%s) — %s",
+                endpoint.key,
+                endpoint.failures,
+                err,
+            )
+            return
+
+        endpoint.record_success()
+        fetched.update(self._apply(endpoint.key, values))
+        _LOGGER.debug("Coordinator: %s = %s", endpoint.key, values)
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch every due endpoint from SMS.to API in parallel."""
+        _LOGGER.debug("Coordinator: fetching SMS.to account data.")
+
+        now = time.monotonic()
+        due = [e for e in self.endpoints.values() if e.is_due(now)]
+        fetched: dict[str, Any] = {}
+        await asyncio.gather(
+            *(self._async_update_endpoint(e, fetched, now) for e in due)
+        )
 
-        _LOGGER.debug("Coordinator: update complete — %s", data)
+        if all(e.last_success is None for e in self.endpoints.values()):
+            errors = "; ".join(
+                f"{e.key}: {e.last_error}" for e in self.endpoints.values()
+            )
+            raise UpdateFailed(f"Failed to fetch SMS.to account data: {errors}")
+
+        _LOGGER.debug(
+            "Coordinator: update complete (fetched: %s) — %s",
+            [e.key for e in due],
+            fetched,
+        )
+        # Merge into the current values: local data (breaker, ledger) may
+        # have changed while the requests were running
+        data: dict[str, Any] = dict(self.data or {})
+        for endpoint in self.endpoints.values():
+            for key in endpoint.data_keys:
+                data.setdefault(key, None)
+        data.update(fetched)
+        if "balance" in fetched:
+            # Sends settled during the fetch are already charged to the ledger
+            data.update(self.ledger_data())
+        if self.service.metrics is not None:
+            data.update(self.service.metrics.sensor_values())
+        self._store.async_delay_save(self._cache_to_save, CACHE_SAVE_DELAY)
         return data
@@ -0,0 +1,96 @@
+"""Alert-storm deduplication for the SMS.to integration."""
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SMSToDeduplicator:
+    """Suppress identical messages sent again within a time window.
+
+    Messages are keyed on a hash of their sorted targets, title and text.
+    The first accepted occurrence opens a window of ``window`` seconds; identical
+    messages inside it are counted instead of sent. Keys live in a bounded
+    LRU cache, so a storm of distinct messages cannot grow memory.
+    """
+
+    def __init__(self, window: float, max_size: int) -> None:
+        """Initialize the deduplicator."""
+        self._window = window
+        self._max_size = max_size
+        # key → [window start (monotonic), suppressed count]
+        self._cache: OrderedDict[str, list[float | int]] = OrderedDict()
+        self.suppressed = 0
+        self.last_suppressed: str | None = None
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if deduplication is active."""
+        return self._window > 0
+
+    @staticmethod
+    def _key(target: list[str], title: str, message: str) -> str:
+        """Return the cache key of a message."""
+        raw = "\x1f".join((*sorted(target), "", title, message))
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def is_duplicate(self, target: list[str], title: str, message: str) -> bool:
+        """Return True, and count it, if the message repeats one still in its window.
+
+        Only a message that was accepted opens a window; call ``record`` once
+        it is queued.
+        """
+        if not self.enabled:
+            return False
+
+        now = time.monotonic()
+        key = self._key(target, title, message)
+        entry = self._cache.get(key)
+        if entry is None or now - entry[0] >= self._window:
+            return False
+
+        entry[1] += 1
+        self._cache.move_to_end(key)
+        self.suppressed += 1
+        self.last_suppressed = dt_util.utcnow().isoformat()
+        _LOGGER.debug(
+            "Duplicate SMS suppressed (%s times in this window) — targets: %s",
+            entry[1],
+            target,
+        )
+        return True
+
+    def record(self, target: list[str], title: str, message: str) -> None:
+        """Open a window for a message that was accepted for delivery."""
+        if not self.enabled:
+            return
+
+        now = time.monotonic()
+        key = self._key(target, title, message)
+        self._cache[key] = [now, 0]
+        self._cache.move_to_end(key)
+        self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired keys from the LRU end, then enforce the size bound."""
+        while self._cache:
+            oldest = next(iter(self._cache.values()))
+            if now - oldest[0] < self._window:
+                break
+            self._cache.popitem(last=False)
+        while len(self._cache) > self._max_size:
+            self._cache.popitem(last=False)
+
+    def attributes(self) -> dict[str, Any]:
+        """Return the suppression state as entity attributes."""
+        return {
+            "window_seconds": self._window,
+            "tracked_messages": len(self._cache),
+            "suppressed_in_open_windows": sum(int(e[1]) for e in self._cache.values()),
+            "last_suppressed": self.last_suppressed,
+        }
@@ -0,0 +1,46 @@
+"""Diagnostics support for SMS.to."""
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_API_KEY, CONF_WEBHOOK_ID, DOMAIN
+
+TO_REDACT = {CONF_API_KEY, CONF_WEBHOOK_ID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "account": {
+            "id": entry_data["account"].account_id,
+            "entries": len(entry_data["account"].members),
+        },
+        "api": entry_data["metrics"].as_dict(),
+        "circuit_breaker": entry_data["breaker"].attributes(),
+        "rate_limit": entry_data["limiter"].rate,
+        "polling": {
+            key: {
+                "interval": endpoint.interval.total_seconds(),
+                "last_success": endpoint.last_success,
+                "failures": endpoint.failures,
+                "last_error": endpoint.last_error,
+            }
+            for key, endpoint in coordinator.endpoints.items()
+        },
+        "ledger": entry_data["ledger"].attributes(),
+        "spool": {
+            "pending": entry_data["spool"].pending,
+            "lanes": entry_data["spool"].lane_depths,
+        },
+        "dedup": entry_data["dedup"].attributes(),
+        "digest": {"pending": entry_data["digest"].pending},
+        "quota": entry_data["quota"].attributes(),
+    }
@@ -0,0 +1,171 @@
+"""Digest mode of the SMS.to integration."""
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_CONCURRENCY
+from .encoding import analyze_message
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def digest_line(message: str, title: str = "") -> str:
+    """Return the line a message takes up in a digest."""
+    return f"{title}: {message}" if title else message
+
+
+@dataclass
+class _Digest:
+    """Messages waiting to be sent to one recipient as a single SMS."""
+
+    target: str
+    data: dict[str, Any]
+    lines: list[str] = field(default_factory=list)
+    # Lines left out while the recipient was over quota
+    dropped: int = 0
+    handle: asyncio.TimerHandle | None = None
+
+    @property
+    def text(self) -> str:
+        """Return the merged SMS text."""
+        if self.dropped:
+            return "\n".join((*self.lines, f"(+{self.dropped} more)"))
+        return "\n".join(self.lines)
+
+
+class SMSToDigest:
+    """Roll low-priority messages into one SMS per recipient.
+
+    The first message for a recipient opens a digest and a timer of
+    ``window`` seconds; later ones are appended as lines. A digest is sent
+    when its timer fires, or earlier when the next line would make it
+    longer than ``max_segments`` segments — that line then opens the next
+    digest. Messages with different send options are digested separately.
+
+    ``hold(recipient)`` returns the seconds until the recipient may receive
+    another SMS (its quota). While it is held, a digest stays open: its
+    timer is pushed back, and lines that no longer fit are only counted.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        window: float,
+        max_segments: int,
+        submit: Callable[..., str],
+        hold: Callable[[str], float] | None = None,
+    ) -> None:
+        """Initialize the digest buffer."""
+        self._hass = hass
+        self._window = window
+        self._max_segments = max_segments
+        self._submit = submit
+        self._hold = hold
+        self._digests: dict[str, _Digest] = {}
+
+    @property
+    def pending(self) -> int:
+        """Return the number of buffered messages."""
+        return sum(
+            len(digest.lines) + digest.dropped for digest in self._digests.values()
+        )
+
+    def _held_for(self, recipient: str) -> float:
+        """Return the seconds ``recipient`` must wait for its next SMS."""
+        return self._hold(recipient) if self._hold is not None else 0.0
+
+    @callback
+    def async_add(
+        self, message: str, title: str, target: list[str], data: dict[str, Any]
+    ) -> None:
+        """Buffer a message for each of its recipients."""
+        line = digest_line(message, title)
+        options = json.dumps(data, sort_keys=True, default=str)
+
+        for recipient in dict.fromkeys(target):
+            key = f"{recipient}|{options}"
+            digest = self._digests.get(key)
+            if digest is not None and (
+                analyze_message(f"{digest.text}\n{line}").segments
+                > self._max_segments
+            ):
+                if self._held_for(recipient):
+                    # Over quota: a new digest would only queue another SMS
+                    self._count_dropped(digest)
+                    continue
+                # Full — send what we have and start over with this line
+                self._flush(key)
+                digest = None
+
+            if digest is None:
+                digest = _Digest(target=recipient, data=data)
+                digest.handle = self._hass.loop.call_later(
+                    self._window, self._flush, key
+                )
+                self._digests[key] = digest
+            digest.lines.append(line)
+
+    def _count_dropped(self, digest: _Digest) -> None:
+        """Count one more line left out, keeping the digest within its size."""
+        digest.dropped += 1
+        while (
+            len(digest.lines) > 1
+            and analyze_message(digest.text).segments > self._max_segments
+        ):
+            digest.lines.pop()
+            digest.dropped += 1
+
+    @callback
+    def _flush(self, key: str, force: bool = False) -> None:
+        """Submit a digest as a single message, unless its recipient is held."""
+        digest = self._digests[key]
+        if digest.handle is not None:
+            digest.handle.cancel()
+            digest.handle = None
+        if not force and (wait := self._held_for(digest.target)):
+            _LOGGER.debug(
+                "Digest: %s is over quota — holding %s message(s) for %.0fs.",
+                digest.target,
+                len(digest.lines) + digest.dropped,
+                wait,
+            )
+            digest.handle = self._hass.loop.call_later(wait, self._flush, key)
+            return
+        del self._digests[key]
+
+        try:
+            self._submit(
+                message=digest.text,
+                title="",
+                target=[digest.target],
+                data=digest.data,
+                chunk_size=DEFAULT_CHUNK_SIZE,
+                max_concurrency=DEFAULT_MAX_CONCURRENCY,
+            )
+        except Exception as err:  # the lines are lost, but others keep flowing
+            _LOGGER.error(
+                "Digest: failed to queue %s message(s) for %s — %s",
+                len(digest.lines),
+                digest.target,
+                err,
+            )
+            return
+        _LOGGER.debug(
+            "Digest: sent %s message(s) to %s as one SMS.",
+            len(digest.lines),
+            digest.target,
+        )
+
+    @callback
+    def async_flush_all(self) -> None:
+        """Submit every open digest immediately (e.g. before unloading).
+
+        Held digests are submitted too; the submit callback defers them.
+        """
+        for key in list(self._digests):
+            self._flush(key, force=True)
@@ -0,0 +1,93 @@
+"""SMS encoding analysis and cost estimation for the SMS.to integration."""
+from dataclasses import asdict, dataclass
+from typing import Any
+
+# GSM 03.38 default alphabet — one septet each
+GSM7_BASIC = frozenset(
+    "@£$¥èéùìòÇ\nØø\rÅåΔ_ΦΓΛΩΠΨΣΘΞÆæßÉ !\"#¤%&'()*+,-./0123456789:;<=>?"
+    "¡ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§¿abcdefghijklmnopqrstuvwxyzäöñüà"
+)
+# GSM 03.38 extension table — escape + character, two septets each
+GSM7_EXTENDED = frozenset("\f^{}\\[~]|€")
+
+ENCODING_GSM7 = "GSM-7"
+ENCODING_UCS2 = "UCS-2"
+
+# (single-segment limit, per-segment limit once concatenated) in code units
+SEGMENT_LIMITS = {
+    ENCODING_GSM7: (160, 153),
+    ENCODING_UCS2: (70, 67),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class MessageAnalysis:
+    """Encoding and segmentation of an SMS text."""
+
+    encoding: str
+    characters: int
+    units: int
+    segments: int
+    non_gsm_characters: tuple[str, ...]
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the analysis as a JSON-serializable dict."""
+        data = asdict(self)
+        data["non_gsm_characters"] = list(self.non_gsm_characters)
+        return data
+
+
+def _unit_widths(text: str) -> tuple[str, list[int], tuple[str, ...]]:
+    """Return the encoding, the width of every character and non-GSM characters."""
+    non_gsm = tuple(
+        dict.fromkeys(
+            c for c in text if c not in GSM7_BASIC and c not in GSM7_EXTENDED
+        )
+    )
+    if not non_gsm:
+        return ENCODING_GSM7, [2 if c in GSM7_EXTENDED else 1 for c in text], ()
+    # UCS-2 counts UTF-16 code units: characters outside the BMP take two
+    return ENCODING_UCS2, [2 if ord(c) > 0xFFFF else 1 for c in text], non_gsm
+
+
+def analyze_message(text: str) -> MessageAnalysis:
+    """Return the encoding and number of segments ``text`` will be sent as.
+
+    Multi-unit characters (GSM-7 escapes, UTF-16 surrogate pairs) are never
+    split across segments, matching how handsets and SMSCs concatenate.
+    """
+    encoding, widths, non_gsm = _unit_widths(text)
+    units = sum(widths)
+    single, multi = SEGMENT_LIMITS[encoding]
+
+    if units <= single:
+        segments = 1 if units else 0
+    else:
+        segments, used = 1, 0
+        for width in widths:
+            if used + width > multi:
+                segments += 1
+                used = 0
+            used += width
+
+    return MessageAnalysis(
+        encoding=encoding,
+        characters=len(text),
+        units=units,
+        segments=segments,
+        non_gsm_characters=non_gsm,
+    )
+
+
+def estimate_cost(
+    analysis: MessageAnalysis, recipients: int, cost_per_segment: float
+) -> dict[str, Any]:
+    """Return the analysis together with the estimated cost of a send."""
+    per_recipient = round(analysis.segments * cost_per_segment, 4)
+    return {
+        **analysis.as_dict(),
+        "recipients": recipients,
+        "cost_per_segment": cost_per_segment,
+        "cost_per_recipient": per_recipient,
+        "estimated_cost": round(per_recipient * recipients, 4),
+    }
@@ -0,0 +1,37 @@
+"""Exceptions for the SMS.to integration."""
+from homeassistant.exceptions import HomeAssistantError
+
+
+class SMSToApiError(HomeAssistantError):
+    """Error raised when an SMS.to API request fails."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        """Initialize the error with the HTTP status, if any."""
+        super().__init__(message)
+        self.status = status
+
+    @property
+    def retryable(self) -> bool:
+        """Return True if the failure is transient and worth retrying.
+
+        A missing status means the request never got an HTTP response
+        (network error or timeout).
+        """
+        return self.status is None or self.status == 429 or self.status >= 500
+
+
+class SMSToCircuitOpenError(SMSToApiError):
+    """Error raised without a request while the circuit breaker is open."""
+
+
+class SMSToDeliveryUnknownError(SMSToApiError):
+    """Error raised when a send request was made but its outcome is unknown.
+
+    The connection dropped or timed out after the request went out, so
+    SMS.to may have accepted (and billed) the message. It is never retried.
+    """
+
+    @property
+    def retryable(self) -> bool:
+        """Return False: resending could deliver the message twice."""
+        return False
@@ -0,0 +1,289 @@
+"""Incremental message-history sync for the SMS.to integration."""
+import logging
+import time
+from collections import defaultdict
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    HISTORY_FAILED_STATUSES,
+    HISTORY_FINAL_STATUSES,
+    HISTORY_MAX_PAGES,
+    HISTORY_PAGE_SIZE,
+    HISTORY_PROBE_SIZE,
+    HISTORY_RETENTION_DAYS,
+    HISTORY_SAVE_DELAY,
+    HISTORY_STATS_WINDOW_HOURS,
+)
+from .notify import SMSToNotificationService
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+
+def _record_id(record: dict[str, Any]) -> str | None:
+    """Return the message id of an API record."""
+    for key in ("_id", "id", "message_id"):
+        if record.get(key):
+            return str(record[key])
+    return None
+
+
+def _record_timestamp(record: dict[str, Any]) -> float | None:
+    """Return the creation time of an API record as a UNIX timestamp."""
+    value = record.get("created_at")
+    if not value:
+        return None
+    parsed = dt_util.parse_datetime(str(value))
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.UTC)
+    return parsed.timestamp()
+
+
+class SMSToMessageHistory:
+    """Local, incrementally synced index of sent messages.
+
+    The first sync pages through ``/v2/messages`` back to the retention
+    horizon. Later syncs read newest-first and stop as soon as they reach
+    the high-water mark — or the oldest recent message whose status may
+    still change — so a quiet account costs one small request per poll.
+
+    Records are stored compactly by id (``s`` status, ``t`` created,
+    ``c`` cost) and indexed in memory by status and by local date.
+
+    When ``push_updates`` is set, status changes arrive through delivery
+    reports, so syncs only read messages newer than the high-water mark.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        account_id: str,
+        service: SMSToNotificationService,
+    ) -> None:
+        """Initialize the history of one SMS.to account (see account.py)."""
+        self._hass = hass
+        # API client used by syncs; repointed when its entry unloads
+        self.service = service
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{account_id}.history"
+        )
+        self._records: dict[str, dict[str, Any]] = {}
+        self._by_status: dict[str, set[str]] = defaultdict(set)
+        self._by_date: dict[str, set[str]] = defaultdict(set)
+        self._high_water: float | None = None
+        self.total: int | None = None
+        self.push_updates = False
+
+    async def async_load(self) -> None:
+        """Load persisted records and rebuild the indexes."""
+        stored = await self._store.async_load() or {}
+        self._high_water = stored.get("high_water")
+        self.total = stored.get("total")
+        for message_id, record in stored.get("records", {}).items():
+            self._index(message_id, record)
+        _LOGGER.debug("History: loaded %s record(s).", len(self._records))
+
+    async def async_migrate(self, entry_id: str) -> None:
+        """Merge and remove the history file an entry kept before accounts.
+
+        Records already known are kept; the old sync state is only used
+        when this history has none of its own.
+        """
+        legacy: Store[dict[str, Any]] = Store(
+            self._hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.history"
+        )
+        if (stored := await legacy.async_load()) is None:
+            return
+        if self._high_water is None:
+            self._high_water = stored.get("high_water")
+            self.total = stored.get("total")
+        records = stored.get("records", {})
+        for message_id, record in records.items():
+            if message_id not in self._records:
+                self._index(message_id, record)
+        await self._store.async_save(self._data_to_save())
+        await legacy.async_remove()
+        _LOGGER.info(
+            "History: migrated %s record(s) from entry %s.", len(records), entry_id
+        )
+
+    async def async_save(self) -> None:
+        """Write pending changes now instead of after the save delay."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the history to persist."""
+        return {
+            "high_water": self._high_water,
+            "total": self.total,
+            "records": self._records,
+        }
+
+    @callback
+    def _index(self, message_id: str, record: dict[str, Any]) -> None:
+        """Insert or replace a record and keep the indexes in sync."""
+        if (previous := self._records.get(message_id)) is not None:
+            self._by_status[previous["s"]].discard(message_id)
+            self._by_date[self._date_key(previous["t"])].discard(message_id)
+
+        self._records[message_id] = record
+        self._by_status[record["s"]].add(message_id)
+        self._by_date[self._date_key(record["t"])].add(message_id)
+
+    @callback
+    def _remove(self, message_id: str) -> None:
+        """Remove a record from the store and the indexes."""
+        record = self._records.pop(message_id)
+        self._by_status[record["s"]].discard(message_id)
+        self._by_date[self._date_key(record["t"])].discard(message_id)
+
+    @staticmethod
+    def _date_key(timestamp: float) -> str:
+        """Return the local date of a timestamp as YYYY-MM-DD."""
+        return dt_util.as_local(dt_util.utc_from_timestamp(timestamp)).date().isoformat()
+
+    @callback
+    def async_update_record(
+        self,
+        message_id: str,
+        status: str,
+        created: float | None = None,
+        cost: float | None = None,
+    ) -> None:
+        """Insert or update a single record (e.g. from a send response)."""
+        previous = self._records.get(message_id, {})
+        record = {
+            "s": status.upper(),
+            "t": created or previous.get("t") or time.time(),
+            "c": cost if cost is not None else previous.get("c"),
+        }
+        self._index(message_id, record)
+        self._store.async_delay_save(self._data_to_save, HISTORY_SAVE_DELAY)
+
+    def _refresh_floor(self, now: float) -> float:
+        """Return the creation time down to which the next sync must read."""
+        horizon = now - HISTORY_RETENTION_DAYS * 86400
+        if self._high_water is None:
+            return horizon
+
+        if self.push_updates:
+            return max(self._high_water, horizon)
+
+        # Recent messages without a final status may still change
+        window_start = now - HISTORY_STATS_WINDOW_HOURS * 3600
+        floor = self._high_water
+        for record in self._records.values():
+            if record["t"] >= window_start and record["s"] not in HISTORY_FINAL_STATUSES:
+                floor = min(floor, record["t"])
+        return max(floor, horizon)
+
+    async def _async_read_until(self, floor: float, limit: int, max_pages: int) -> bool:
+        """Read pages newest-first until ``floor``; return True if it was reached."""
+        for page in range(1, max_pages + 1):
+            data = await self.service.async_get_messages_page(page=page, limit=limit)
+            if page == 1 and data.get("total") is not None:
+                self.total = data["total"]
+
+            records = data.get("data") or []
+            reached = False
+            for item in records:
+                message_id = _record_id(item)
+                created = _record_timestamp(item)
+                if message_id is None or created is None:
+                    continue
+                if created < floor:
+                    reached = True
+                    continue
+                self._index(
+                    message_id,
+                    {
+                        "s": str(item.get("status", "UNKNOWN")).upper(),
+                        "t": created,
+                        "c": item.get("cost"),
+                    },
+                )
+                if self._high_water is None or created > self._high_water:
+                    self._high_water = created
+
+            last_page = data.get("last_page")
+            if reached or len(records) < limit or (last_page and page >= last_page):
+                return True
+        return False
+
+    async def async_sync(self) -> dict[str, Any]:
+        """Fetch new and still-changing records, then return the statistics."""
+        now = time.time()
+        floor = self._refresh_floor(now)
+        initial = self._high_water is None
+
+        try:
+            # Probe with a small page first; page in full only if there is more
+            complete = not initial and await self._async_read_until(
+                floor, HISTORY_PROBE_SIZE, 1
+            )
+            if not complete:
+                complete = await self._async_read_until(
+                    floor, HISTORY_PAGE_SIZE, HISTORY_MAX_PAGES
+                )
+        except Exception:
+            if initial:
+                # Keep treating the next sync as initial so no pages are skipped
+                self._high_water = None
+            raise
+
+        if not complete:
+            _LOGGER.warning(
+                "History: stopped after %s pages before reaching %s.",
+                HISTORY_MAX_PAGES,
+                dt_util.utc_from_timestamp(floor).isoformat(),
+            )
+
+        self._prune(now)
+        self._store.async_delay_save(self._data_to_save, HISTORY_SAVE_DELAY)
+        return self.statistics(now)
+
+    @callback
+    def _prune(self, now: float) -> None:
+        """Drop records older than the retention horizon."""
+        horizon = now - HISTORY_RETENTION_DAYS * 86400
+        for message_id in [m for m, r in self._records.items() if r["t"] < horizon]:
+            self._remove(message_id)
+        for index in (self._by_status, self._by_date):
+            for key in [k for k, ids in index.items() if not ids]:
+                del index[key]
+
+    @callback
+    def statistics(self, now: float | None = None) -> dict[str, Any]:
+        """Return aggregate statistics from the local index."""
+        now = now or time.time()
+        window_start = now - HISTORY_STATS_WINDOW_HOURS * 3600
+        today = dt_util.now().date().isoformat()
+
+        failed = sum(
+            1
+            for status in HISTORY_FAILED_STATUSES
+            for message_id in self._by_status.get(status, ())
+            if self._records[message_id]["t"] >= window_start
+        )
+        delivered = sum(
+            1
+            for message_id in self._by_status.get("DELIVERED", ())
+            if self._records[message_id]["t"] >= window_start
+        )
+        settled = delivered + failed
+
+        return {
+            "total_messages": self.total,
+            "sent_today": len(self._by_date.get(today, ())),
+            "failed_24h": failed,
+            "delivery_rate": round(delivered / settled * 100, 1) if settled else None,
+        }
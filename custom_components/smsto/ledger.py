@@ -0,0 +1,125 @@
+"""Local balance ledger for the SMS.to integration."""
+import logging
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import FLOOR_ACTION_REFUSE
+from .encoding import analyze_message
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SMSToLedger:
+    """Predict the account balance between API reconciliations.
+
+    The ledger starts from the last balance fetched from SMS.to and
+    subtracts the cost of every settled send — the cost reported by the
+    API, or an estimate from the message segments when none is reported.
+    Messages still queued hold their estimated cost in ``reserved`` (shared
+    by every entry of the account) until they are settled. A configured
+    ``floor`` lets sends that would take the predicted balance, less those
+    reservations, below it be refused or demoted to the bulk lane.
+    """
+
+    def __init__(
+        self,
+        cost_per_segment: float,
+        floor: float,
+        floor_action: str,
+        reserved: dict[str, float],
+    ) -> None:
+        """Initialize the ledger."""
+        self._cost_per_segment = cost_per_segment
+        self._floor = floor
+        self._floor_action = floor_action
+        # Spool id → estimated cost of a queued message
+        self._reserved = reserved
+        self.balance: float | None = None
+        self.reconciled_balance: float | None = None
+        self.reconciled_at: str | None = None
+        self.spent_since_reconcile = 0.0
+        self.sends_since_reconcile = 0
+
+    def reconcile(self, balance: float | None, at: float | None = None) -> None:
+        """Reset the prediction to a balance fetched from the API (at ``at``)."""
+        if balance is None:
+            return
+        if self.balance is not None and self.sends_since_reconcile:
+            _LOGGER.debug(
+                "Ledger: predicted %.2f, API reports %.2f (drift %.4f).",
+                self.balance,
+                balance,
+                balance - self.balance,
+            )
+        self.balance = self.reconciled_balance = balance
+        self.reconciled_at = (
+            dt_util.utc_from_timestamp(at) if at is not None else dt_util.utcnow()
+        ).isoformat()
+        self.spent_since_reconcile = 0.0
+        self.sends_since_reconcile = 0
+
+    def estimate(self, text: str, recipients: int) -> float:
+        """Return the estimated cost of sending ``text`` to ``recipients``."""
+        return analyze_message(text).segments * self._cost_per_segment * recipients
+
+    @property
+    def reserved(self) -> float:
+        """Return the estimated cost of every message still queued."""
+        return sum(self._reserved.values())
+
+    def reserve(self, message_id: str, cost: float) -> None:
+        """Hold the estimated cost of a queued message until it is settled."""
+        self._reserved[message_id] = cost
+
+    def release(self, message_id: str) -> None:
+        """Drop the reservation of a settled (or unloaded) message."""
+        self._reserved.pop(message_id, None)
+
+    def record(self, text: str, result: dict[str, Any]) -> float:
+        """Subtract the cost of a settled send and return it."""
+        if not result.get("sent"):
+            return 0.0
+        cost = result.get("cost")
+        if cost is None:
+            cost = self.estimate(text, result["sent"])
+
+        self.spent_since_reconcile += cost
+        self.sends_since_reconcile += 1
+        if self.balance is not None:
+            self.balance = round(self.balance - cost, 4)
+        return cost
+
+    def crosses_floor(self, cost: float) -> bool:
+        """Return True if a send of ``cost`` would take the balance below the floor."""
+        if self._floor <= 0 or self.balance is None:
+            return False
+        return self.balance - self.reserved - cost < self._floor
+
+    def check(self, cost: float) -> str | None:
+        """Return the floor action if a send of ``cost`` would cross the floor."""
+        if not self.crosses_floor(cost):
+            return None
+        _LOGGER.warning(
+            "Ledger: send of ~%.2f would take the balance (%.2f, %.2f reserved) "
+            "below the floor of %.2f — %s.",
+            cost,
+            self.balance,
+            self.reserved,
+            self._floor,
+            "refusing" if self._floor_action == FLOOR_ACTION_REFUSE else "demoting",
+        )
+        return self._floor_action
+
+    def attributes(self) -> dict[str, Any]:
+        """Return the ledger state as entity attributes."""
+        return {
+            "predicted": self.balance is not None and self.sends_since_reconcile > 0,
+            "reconciled_balance": self.reconciled_balance,
+            "reconciled_at": self.reconciled_at,
+            "spent_since_reconcile": round(self.spent_since_reconcile, 4),
+            "reserved": round(self.reserved, 4),
+            "floor": self._floor or None,
+            "floor_action": self._floor_action if self._floor else None,
+        }
+
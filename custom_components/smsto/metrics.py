@@ -0,0 +1,130 @@
+"""Request instrumentation for the SMS.to API client."""
+import bisect
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .const import (
+    API_URL_BALANCE,
+    API_URL_MESSAGES,
+    API_URL_SEND,
+    METRICS_BUCKETS_MS,
+    METRICS_SAMPLE_SIZE,
+)
+
+ENDPOINT_NAMES = {
+    API_URL_SEND: "send",
+    API_URL_BALANCE: "balance",
+    API_URL_MESSAGES: "messages",
+}
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float | None:
+    """Return the nearest-rank percentile of already sorted values."""
+    if not sorted_values:
+        return None
+    rank = max(1, round(percent / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class EndpointMetrics:
+    """Counters and recent latencies of one API endpoint."""
+
+    requests: int = 0
+    errors: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    statuses: Counter[str] = field(default_factory=Counter)
+    # Requests per latency bucket; the last one is "slower than all bounds"
+    buckets: list[int] = field(
+        default_factory=lambda: [0] * (len(METRICS_BUCKETS_MS) + 1)
+    )
+    # (latency in ms, failed) of the most recent requests
+    recent: deque[tuple[float, bool]] = field(
+        default_factory=lambda: deque(maxlen=METRICS_SAMPLE_SIZE)
+    )
+
+    def summary(self) -> dict[str, Any]:
+        """Return percentiles and rates over the recent requests plus totals."""
+        latencies = sorted(latency for latency, _ in self.recent)
+        failed = sum(1 for _, error in self.recent if error)
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "p50_ms": _percentile(latencies, 50),
+            "p95_ms": _percentile(latencies, 95),
+            "p99_ms": _percentile(latencies, 99),
+            "error_rate": (
+                round(failed / len(self.recent) * 100, 1) if self.recent else None
+            ),
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "statuses": dict(self.statuses),
+            "histogram_ms": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(METRICS_BUCKETS_MS, self.buckets)
+                },
+                "inf": self.buckets[-1],
+            },
+        }
+
+
+class SMSToMetrics:
+    """Latency, status and transfer statistics of every API request.
+
+    Recording is O(log buckets) and keeps a bounded sample per endpoint,
+    so instrumentation costs nothing noticeable next to a network call.
+    A request fails when it raises or answers with a status of 400 or more.
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def record(
+        self,
+        url: str,
+        latency: float,
+        status: int | None,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+    ) -> None:
+        """Record one request; ``status`` is None if no response arrived."""
+        endpoint = self.endpoints.setdefault(
+            ENDPOINT_NAMES.get(url, url), EndpointMetrics()
+        )
+        latency_ms = round(latency * 1000, 1)
+        failed = status is None or status >= 400
+
+        endpoint.requests += 1
+        endpoint.errors += failed
+        endpoint.bytes_sent += bytes_sent
+        endpoint.bytes_received += bytes_received
+        endpoint.statuses[str(status) if status is not None else "error"] += 1
+        endpoint.buckets[bisect.bisect_left(METRICS_BUCKETS_MS, latency_ms)] += 1
+        endpoint.recent.append((latency_ms, failed))
+
+    def sensor_values(self) -> dict[str, Any]:
+        """Return the values of the diagnostic sensors."""
+        summaries = {name: e.summary() for name, e in self.endpoints.items()}
+        send = summaries.get("send", {})
+        recent = [sample for e in self.endpoints.values() for sample in e.recent]
+        failed = sum(1 for _, error in recent if error)
+        return {
+            "send_latency_p50": send.get("p50_ms"),
+            "send_latency_p95": send.get("p95_ms"),
+            "api_error_rate": round(failed / len(recent) * 100, 1) if recent else None,
+            "api_metrics": {
+                name: {
+                    key: summary[key]
+                    for key in ("requests", "p50_ms", "p95_ms", "error_rate")
+                }
+                for name, summary in summaries.items()
+            },
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the full statistics (for diagnostics)."""
+        return {name: e.summary() for name, e in self.endpoints.items()}
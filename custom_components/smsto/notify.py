@@ -1,5 +1,12 @@
 """SMS.to notification service and API client."""
+import asyncio
+import hashlib
+import json
 import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any
 
 import aiohttp
 
@@ -9,50 +16,211 @@ from .const import (
     API_URL_BALANCE,
     API_URL_MESSAGES,
     API_URL_SEND,
+    DEFAULT_CHUNK_SIZE,
     DEFAULT_ERROR_MESSAGE,
+    DEFAULT_MAX_CONCURRENCY,
     DEFAULT_TIMEOUT,
     ERROR_MESSAGES,
+    IDEMPOTENCY_CACHE_SIZE,
+    RATE_LIMIT_MAX_INLINE_WAIT,
+    RATE_LIMIT_MAX_RETRIES,
+    RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_MAX_DELAY,
 )
+from .breaker import SMSToCircuitBreaker
+from .exceptions import (
+    SMSToApiError,
+    SMSToCircuitOpenError,
+    SMSToDeliveryUnknownError,
+)
+from .metrics import SMSToMetrics
+from .ratelimit import SMSToRateLimiter, parse_retry_after
+from .retry import RetryPolicy
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def compose_message(message: str, title: str = "") -> str:
+    """Return the SMS text for a message and optional title."""
+    return f"{title}\n\n{message}" if title else message
+
+
+def parse_send_response(response_text: str, target: list[str]) -> dict[str, Any]:
+    """Return the structured result of a successful send response.
+
+    SMS.to answers with a ``message_id`` (or a ``campaign_id`` for larger
+    sends) and, for some requests, a per-recipient ``messages`` list; every
+    field is optional so an unexpected body still yields a usable result.
+    """
+    try:
+        body = json.loads(response_text) if response_text else {}
+    except ValueError:
+        body = {}
+    if not isinstance(body, dict):
+        body = {}
+
+    message_id = body.get("message_id") or body.get("_id")
+    status = str(body.get("status") or "QUEUED").upper()
+    recipients = {
+        number: {
+            "success": True,
+            "message_id": message_id,
+            "status": status,
+            "error": None,
+        }
+        for number in target
+    }
+    for item in body.get("messages") or []:
+        number = item.get("to") or item.get("phone")
+        if number in recipients:
+            recipients[number]["message_id"] = (
+                item.get("message_id") or item.get("_id") or message_id
+            )
+            recipients[number]["status"] = str(item.get("status") or status).upper()
+
+    return {
+        "message_id": message_id,
+        "campaign_id": body.get("campaign_id"),
+        "status": status,
+        "cost": body.get("cost", body.get("estimated_cost")),
+        "recipients": recipients,
+    }
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy(
+    attempts=RETRY_ATTEMPTS, base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY
+)
+
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT)
+
+
 class SMSToNotificationService:
     """SMS.to API client for sending SMS and fetching account data."""
 
     def __init__(
-        self, api_key: str, sender_id: str, session: aiohttp.ClientSession
+        self,
+        api_key: str,
+        sender_id: str,
+        session: aiohttp.ClientSession,
+        limiter: SMSToRateLimiter | None = None,
+        retry_policy: RetryPolicy = DEFAULT_RETRY_POLICY,
+        breaker: SMSToCircuitBreaker | None = None,
+        metrics: SMSToMetrics | None = None,
     ) -> None:
         """Initialize the service."""
         self._api_key = api_key
         self._sender_id = sender_id
         self._session = session
+        self._limiter = limiter
+        self._retry_policy = retry_policy
+        self.breaker = breaker
+        self.metrics = metrics
+        # Built once — every request reuses the same header mapping
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
+        # Default delivery-report URL, injected unless a call passes its own
+        self.callback_url: str | None = None
+        # Idempotency keys of confirmed sends → response text
+        self._delivered: OrderedDict[str, str] = OrderedDict()
         _LOGGER.debug(
             "SMSToNotificationService initialized (API key: %s****, Sender ID: %s)",
             api_key[:4],
             sender_id,
         )
 
-    @property
-    def _headers(self) -> dict:
-        """Return default headers for API requests."""
-        return {
-            "Authorization": f"Bearer {self._api_key}",
-            "Content-Type": "application/json",
-        }
-
     def _get_error_message(self, status: int) -> str:
         """Return a human-readable error message for the given HTTP status."""
         return ERROR_MESSAGES.get(status, DEFAULT_ERROR_MESSAGE)
 
-    async def async_send_message(
+    async def _async_request(
         self,
-        message: str = "",
-        title: str = "",
-        target: list[str] | None = None,
-        data: dict | None = None,
+        method: str,
+        url: str,
+        payload: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+    ) -> tuple[int, str]:
+        """Perform a rate-limited API request and return (status, body).
+
+        A 429 response slows the limiter down; the request is then retried
+        inline as long as the server asks for a short enough pause. While the
+        circuit breaker is open, SMSToCircuitOpenError is raised without a
+        request.
+        """
+        # Serialize once: reused across 429 retries and counted by the metrics
+        data = json.dumps(payload).encode() if payload is not None else None
+        attempt = 0
+        while True:
+            if self._limiter is not None:
+                await self._limiter.async_acquire()
+            # Right before the call: a half-open probe slot taken here is
+            # always released by record() or abort() below
+            if self.breaker is not None:
+                self.breaker.before_request()
+
+            started = time.monotonic()
+            try:
+                async with self._session.request(
+                    method,
+                    url,
+                    data=data,
+                    params=params,
+                    headers={**self._headers, **headers} if headers else self._headers,
+                    timeout=REQUEST_TIMEOUT,
+                ) as response:
+                    raw = await response.read()
+                    body = raw.decode(response.get_encoding(), errors="replace")
+                    status = response.status
+                    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                latency = time.monotonic() - started
+                if self.breaker is not None:
+                    self.breaker.record(latency, str(err) or type(err).__name__)
+                if self.metrics is not None:
+                    self.metrics.record(url, latency, None, len(data or b""))
+                raise
+            except BaseException:
+                if self.breaker is not None:
+                    self.breaker.abort()
+                raise
+
+            latency = time.monotonic() - started
+            if self.breaker is not None:
+                self.breaker.record(
+                    latency, f"HTTP {status}" if status >= 500 else None
+                )
+            if self.metrics is not None:
+                self.metrics.record(url, latency, status, len(data or b""), len(raw))
+
+            if self._limiter is None:
+                return status, body
+
+            if status != 429:
+                self._limiter.on_success()
+                return status, body
+
+            self._limiter.on_rate_limited(retry_after)
+            attempt += 1
+            if attempt > RATE_LIMIT_MAX_RETRIES or (
+                retry_after is not None and retry_after > RATE_LIMIT_MAX_INLINE_WAIT
+            ):
+                return status, body
+
+            _LOGGER.debug(
+                "Rate limited on %s %s — retry %s/%s.",
+                method,
+                url,
+                attempt,
+                RATE_LIMIT_MAX_RETRIES,
+            )
+
+    def validate_send_args(
+        self, target: list[str] | None, data: dict | None
     ) -> None:
-        """Send an SMS to the specified targets."""
+        """Validate the target list and extra data of a send request."""
         if not target:
             _LOGGER.error("No target phone number provided.")
             raise HomeAssistantError("No target phone number provided.")
@@ -69,97 +237,277 @@ class SMSToNotificationService:
             _LOGGER.error("Invalid 'data' format: expected a dict, got %s.", type(data))
             raise HomeAssistantError("Invalid 'data' format. Must be a dictionary.")
 
+    def _build_payload(
+        self, message: str, title: str, target: list[str], data: dict | None
+    ) -> dict[str, Any]:
+        """Build the JSON payload for a send request."""
         payload = {
             "to": target,
-            "message": f"{title}\n\n{message}" if title else message,
+            "message": compose_message(message, title),
             "sender_id": self._sender_id,
         }
+        if self.callback_url:
+            payload["callback_url"] = self.callback_url
         if data:
-            payload.update(data)
+            # ``priority`` only picks the local delivery lane
+            payload.update({k: v for k, v in data.items() if k != "priority"})
+        return payload
 
+    async def _async_post_send(
+        self, payload: dict[str, Any], idempotency_key: str
+    ) -> str:
+        """POST a send payload to SMS.to, with retries, and return the response text.
+
+        A key that was already confirmed is answered locally, so a replayed
+        send is not posted twice. Only failures SMS.to answered with a 5xx,
+        or where no connection was made, are retried; a timeout or dropped
+        connection after the request went out raises
+        SMSToDeliveryUnknownError instead.
+        """
+        if (cached := self._delivered.get(idempotency_key)) is not None:
+            _LOGGER.debug("Send %s already confirmed — skipping API call.", idempotency_key)
+            return cached
+
+        response_text = await self._retry_policy.async_call(
+            lambda: self._async_post_send_once(payload, idempotency_key),
+            label=f"SMS send {idempotency_key}",
+        )
+
+        self._delivered[idempotency_key] = response_text
+        if len(self._delivered) > IDEMPOTENCY_CACHE_SIZE:
+            self._delivered.popitem(last=False)
+        return response_text
+
+    async def _async_post_send_once(
+        self, payload: dict[str, Any], idempotency_key: str
+    ) -> str:
+        """Make a single send request and return the response text."""
+        target = payload["to"]
         _LOGGER.debug("Sending SMS — target: %s, payload keys: %s", target, list(payload.keys()))
 
         try:
-            async with self._session.post(
+            status, response_text = await self._async_request(
+                "POST",
                 API_URL_SEND,
-                json=payload,
-                headers=self._headers,
-                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
-            ) as response:
-                response_text = await response.text()
-
-                if response.status != 200:
-                    error_msg = self._get_error_message(response.status)
-                    _LOGGER.error(
-                        "SMS send failed — status: %s, error: %s, response: %s",
-                        response.status,
-                        error_msg,
-                        response_text,
-                    )
-                    raise HomeAssistantError(
-                        f"Error: {error_msg} (Response: {response_text})"
+                payload,
+                headers={"Idempotency-Key": idempotency_key},
+            )
+        except aiohttp.ClientConnectorError as err:
+            _LOGGER.error("ClientError while sending SMS: %s", err)
+            raise SMSToApiError(f"ClientError while sending SMS: {err}") from err
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            # The request may have reached SMS.to — resending could deliver twice
+            _LOGGER.error("SMS send to %s ended without a response: %s", target, err)
+            raise SMSToDeliveryUnknownError(
+                f"Delivery unknown, not retried: {err!r}"
+            ) from err
+
+        if status != 200:
+            error_msg = self._get_error_message(status)
+            _LOGGER.error(
+                "SMS send failed — status: %s, error: %s, response: %s",
+                status,
+                error_msg,
+                response_text,
+            )
+            raise SMSToApiError(
+                f"Error: {error_msg} (Response: {response_text})", status=status
+            )
+
+        _LOGGER.info("SMS sent successfully to: %s", target)
+        return response_text
+
+    async def async_send_message(
+        self,
+        message: str = "",
+        title: str = "",
+        target: list[str] | None = None,
+        data: dict | None = None,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        """Send an SMS to the specified targets and return the parsed result.
+
+        Pass a stable ``idempotency_key`` when the same message may be
+        submitted again (e.g. replayed from a queue); one is generated
+        otherwise.
+        """
+        self.validate_send_args(target, data)
+        response_text = await self._async_post_send(
+            self._build_payload(message, title, target, data),
+            idempotency_key or uuid.uuid4().hex,
+        )
+        return parse_send_response(response_text, target)
+
+    async def async_send_bulk(
+        self,
+        message: str = "",
+        title: str = "",
+        target: list[str] | None = None,
+        data: dict | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        idempotency_key: str | None = None,
+    ) -> dict[str, Any]:
+        """Send an SMS to a large target list as concurrent chunks.
+
+        Every chunk is an independent API request, so a rejected chunk never
+        blocks the others. Returns the outcome per chunk and per recipient.
+        Chunk idempotency keys are derived from ``idempotency_key`` and the
+        chunk's recipients, so re-sending a subset reuses the same keys.
+        """
+        self.validate_send_args(target, data)
+        base_key = idempotency_key or uuid.uuid4().hex
+
+        chunks = [
+            target[index : index + chunk_size]
+            for index in range(0, len(target), chunk_size)
+        ]
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        _LOGGER.debug(
+            "Bulk send — %s targets in %s chunks (chunk size: %s, concurrency: %s)",
+            len(target),
+            len(chunks),
+            chunk_size,
+            max_concurrency,
+        )
+
+        async def _async_send_chunk(index: int, chunk: list[str]) -> dict[str, Any]:
+            """Send one chunk and capture its outcome."""
+            async with semaphore:
+                chunk_digest = hashlib.sha1(
+                    "\n".join(chunk).encode(), usedforsecurity=False
+                ).hexdigest()[:12]
+                try:
+                    response_text = await self._async_post_send(
+                        self._build_payload(message, title, chunk, data),
+                        f"{base_key}-{chunk_digest}",
                     )
+                except SMSToApiError as err:
+                    return {
+                        "chunk": index,
+                        "targets": chunk,
+                        "success": False,
+                        "status": err.status,
+                        "retryable": err.retryable,
+                        # Rejected locally by the breaker, never sent
+                        "circuit_open": isinstance(err, SMSToCircuitOpenError),
+                        "error": str(err),
+                        "message_id": None,
+                        "cost": None,
+                        "recipients": {},
+                    }
+                parsed = parse_send_response(response_text, chunk)
+                return {
+                    "chunk": index,
+                    "targets": chunk,
+                    "success": True,
+                    "status": 200,
+                    "retryable": False,
+                    "circuit_open": False,
+                    "error": None,
+                    "message_id": parsed["message_id"],
+                    "cost": parsed["cost"],
+                    "recipients": parsed["recipients"],
+                }
 
-                _LOGGER.info("SMS sent successfully to: %s", target)
+        chunk_results = await asyncio.gather(
+            *(_async_send_chunk(index, chunk) for index, chunk in enumerate(chunks))
+        )
 
-        except aiohttp.ClientError as err:
-            _LOGGER.error("ClientError while sending SMS: %s", err)
-            raise HomeAssistantError(f"ClientError while sending SMS: {err}") from err
+        recipients: dict[str, dict[str, Any]] = {}
+        for result in chunk_results:
+            # Per-recipient details move from the chunk to the top level
+            outcomes = result.pop("recipients")
+            for number in result["targets"]:
+                outcome = outcomes.get(number, {})
+                recipients[number] = {
+                    "chunk": result["chunk"],
+                    "success": result["success"],
+                    "message_id": outcome.get("message_id"),
+                    "status": outcome.get("status"),
+                    "error": result["error"],
+                }
 
-    async def async_get_balance(self) -> float | None:
-        """Fetch the account balance from SMS.to API."""
-        _LOGGER.debug("Fetching balance from SMS.to API.")
+        sent = sum(len(r["targets"]) for r in chunk_results if r["success"])
+        failed = sum(len(r["targets"]) for r in chunk_results if not r["success"])
+        _LOGGER.info(
+            "Bulk send complete — %s recipients sent, %s failed.", sent, failed
+        )
 
+        costs = [r["cost"] for r in chunk_results if r["cost"] is not None]
+        return {
+            "chunks": chunk_results,
+            "recipients": recipients,
+            "sent": sent,
+            "failed": failed,
+            "cost": round(sum(costs), 4) if costs else None,
+        }
+
+    async def _async_get_json(
+        self, url: str, label: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """GET an API endpoint, with retries, and return its decoded JSON body."""
+        return await self._retry_policy.async_call(
+            lambda: self._async_get_json_once(url, label, params),
+            label=f"Fetching {label}",
+        )
+
+    async def _async_get_json_once(
+        self, url: str, label: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Make a single GET request and return the decoded JSON body."""
         try:
-            async with self._session.get(
-                API_URL_BALANCE,
-                headers=self._headers,
-                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
-            ) as response:
-                if response.status != 200:
-                    error_msg = self._get_error_message(response.status)
-                    _LOGGER.error(
-                        "Balance fetch failed — status: %s, error: %s",
-                        response.status,
-                        error_msg,
-                    )
-                    raise HomeAssistantError(f"Error fetching balance: {error_msg}")
+            status, body = await self._async_request("GET", url, params=params)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.error("ClientError fetching %s: %s", label, err)
+            raise SMSToApiError(f"{label.capitalize()} API error: {err}") from err
 
-                data = await response.json()
-                balance = data.get("balance")
-                _LOGGER.debug("Balance fetched: %s", balance)
-                return balance
+        if status != 200:
+            error_msg = self._get_error_message(status)
+            _LOGGER.error(
+                "%s fetch failed — status: %s, error: %s",
+                label.capitalize(),
+                status,
+                error_msg,
+            )
+            raise SMSToApiError(f"Error fetching {label}: {error_msg}", status=status)
+
+        try:
+            return json.loads(body)
+        except ValueError as err:
+            _LOGGER.error("Invalid JSON fetching %s: %s", label, err)
+            raise SMSToApiError(f"{label.capitalize()} API error: {err}") from err
 
-        except aiohttp.ClientError as err:
-            _LOGGER.error("ClientError fetching balance: %s", err)
-            raise HomeAssistantError(f"Balance API error: {err}") from err
+    async def async_get_balance(self) -> float | None:
+        """Fetch the account balance from SMS.to API."""
+        _LOGGER.debug("Fetching balance from SMS.to API.")
+
+        data = await self._async_get_json(API_URL_BALANCE, "balance")
+        balance = data.get("balance")
+        _LOGGER.debug("Balance fetched: %s", balance)
+        return balance
 
     async def async_get_total_messages(self) -> int | None:
         """Fetch the total number of SMS sent."""
         _LOGGER.debug("Fetching total messages from SMS.to API.")
 
-        try:
-            async with self._session.get(
-                API_URL_MESSAGES,
-                headers=self._headers,
-                timeout=aiohttp.ClientTimeout(total=DEFAULT_TIMEOUT),
-            ) as response:
-                if response.status != 200:
-                    error_msg = self._get_error_message(response.status)
-                    _LOGGER.error(
-                        "Total messages fetch failed — status: %s, error: %s",
-                        response.status,
-                        error_msg,
-                    )
-                    raise HomeAssistantError(
-                        f"Error fetching total messages: {error_msg}"
-                    )
+        data = await self._async_get_json(API_URL_MESSAGES, "total messages")
+        total = data.get("total", 0)
+        _LOGGER.debug("Total messages fetched: %s", total)
+        return total
 
-                data = await response.json()
-                total = data.get("total", 0)
-                _LOGGER.debug("Total messages fetched: %s", total)
-                return total
+    async def async_get_messages_page(self, page: int, limit: int) -> dict[str, Any]:
+        """Fetch one page of sent messages, newest first."""
+        _LOGGER.debug("Fetching messages page %s (limit %s) from SMS.to API.", page, limit)
 
-        except aiohttp.ClientError as err:
-            _LOGGER.error("ClientError fetching total messages: %s", err)
-            raise HomeAssistantError(f"Total messages API error: {err}") from err
+        return await self._async_get_json(
+            API_URL_MESSAGES,
+            "messages",
+            params={
+                "order_by": "created_at",
+                "order_direction": "desc",
+                "limit": limit,
+                "page": page,
+            },
+        )
@@ -0,0 +1,190 @@
+"""Local phone-number normalization for the SMS.to integration."""
+from functools import lru_cache
+import re
+
+from .const import PHONE_CACHE_SIZE
+
+# Country calling code → ISO 3166 countries using it
+_CALLING_CODES = """
+1 BB BS CA DO JM PR TT US
+7 KZ RU
+20 EG
+27 ZA
+30 GR
+31 NL
+32 BE
+33 FR
+34 ES
+36 HU
+39 IT VA
+40 RO
+41 CH
+43 AT
+44 GB
+45 DK
+46 SE
+47 NO
+48 PL
+49 DE
+51 PE
+52 MX
+54 AR
+55 BR
+56 CL
+57 CO
+58 VE
+60 MY
+61 AU
+62 ID
+63 PH
+64 NZ
+65 SG
+66 TH
+81 JP
+82 KR
+84 VN
+86 CN
+90 TR
+91 IN
+92 PK
+94 LK
+98 IR
+212 MA
+213 DZ
+216 TN
+221 SN
+233 GH
+234 NG
+254 KE
+255 TZ
+256 UG
+350 GI
+351 PT
+352 LU
+353 IE
+354 IS
+355 AL
+356 MT
+357 CY
+358 FI
+359 BG
+370 LT
+371 LV
+372 EE
+373 MD
+375 BY
+376 AD
+377 MC
+378 SM
+380 UA
+381 RS
+382 ME
+383 XK
+385 HR
+386 SI
+387 BA
+389 MK
+420 CZ
+421 SK
+423 LI
+502 GT
+506 CR
+507 PA
+591 BO
+593 EC
+595 PY
+598 UY
+852 HK
+880 BD
+886 TW
+961 LB
+962 JO
+964 IQ
+965 KW
+966 SA
+968 OM
+971 AE
+972 IL
+973 BH
+974 QA
+"""
+CALLING_CODES = {
+    country: code
+    for line in _CALLING_CODES.strip().splitlines()
+    for code, *countries in [line.split()]
+    for country in countries
+}
+
+# National trunk prefix where it is not "0"; "" = none, or part of the number
+_NO_TRUNK_PREFIX = """
+BH CR CY DK EE ES GR GT HK IS IT KW LU LV MT MX NO OM PA PL PT QA SG SM UY VA
+"""
+TRUNK_PREFIXES = {
+    **{country: "1" for country, code in CALLING_CODES.items() if code == "1"},
+    **dict.fromkeys(("BY", "KZ", "RU"), "8"),
+    "HU": "06",
+    **dict.fromkeys(_NO_TRUNK_PREFIX.split(), ""),
+}
+
+# Everything users put between digits: spaces, dashes, dots, brackets, slashes
+_FORMATTING = re.compile(r"[\s\-./()]")
+_SEPARATORS = re.compile(r"[,;]")
+# E.164: at most 15 digits; no country code starts with 0
+_E164 = re.compile(r"\+[1-9]\d{7,14}")
+# A bare number is read as international if this many digits follow the code
+_MIN_NATIONAL_DIGITS = 8
+
+
+@lru_cache(maxsize=PHONE_CACHE_SIZE)
+def normalize_number(number: str, country: str | None = None) -> str | None:
+    """Return ``number`` in E.164 format, or None if it is not valid.
+
+    ``+`` and ``00`` mark international numbers. Anything else is a national
+    number of ``country``: its trunk prefix is dropped and the country code
+    added. Where the country has a trunk prefix, a bare number that starts
+    with the country code instead and is long enough to be international
+    (``40740…`` for RO) is taken as is. Without a known country a bare
+    number cannot be read, so its digits are passed on for the API to judge.
+    """
+    digits = _FORMATTING.sub("", number)
+    if digits.startswith("+"):
+        candidate = digits
+    elif digits.startswith("00"):
+        candidate = f"+{digits[2:]}"
+    else:
+        if country is None or (code := CALLING_CODES.get(country.upper())) is None:
+            return digits if digits.isdigit() else None
+        trunk = TRUNK_PREFIXES.get(country.upper(), "0")
+        if trunk and digits.startswith(trunk):
+            candidate = f"+{code}{digits[len(trunk):]}"
+        elif (
+            trunk
+            and digits.startswith(code)
+            and len(digits) - len(code) >= _MIN_NATIONAL_DIGITS
+        ):
+            candidate = f"+{digits}"
+        else:
+            candidate = f"+{code}{digits}"
+
+    return candidate if _E164.fullmatch(candidate) else None
+
+
+def normalize_targets(
+    target: list[str], country: str | None = None
+) -> tuple[list[str], list[str]]:
+    """Split, normalize and deduplicate recipients.
+
+    Returns the valid recipients in E.164 format, in their original order,
+    and the entries that could not be parsed.
+    """
+    valid: dict[str, None] = {}
+    invalid: list[str] = []
+    for item in target:
+        for number in _SEPARATORS.split(item):
+            if not (number := number.strip()):
+                continue
+            if (normalized := normalize_number(number, country)) is None:
+                invalid.append(number)
+            else:
+                valid[normalized] = None
+    return list(valid), invalid
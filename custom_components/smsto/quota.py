@@ -0,0 +1,144 @@
+"""Per-recipient send quotas for the SMS.to integration."""
+import logging
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN, QUOTA_BUCKET_SECONDS, QUOTA_SAVE_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+HOUR_BUCKETS = 3600 // QUOTA_BUCKET_SECONDS
+DAY_BUCKETS = 86400 // QUOTA_BUCKET_SECONDS
+
+
+class SMSToQuota:
+    """Limit how many SMS each phone number receives per hour and per day.
+
+    Sends are counted per number in sparse buckets of
+    ``QUOTA_BUCKET_SECONDS`` (bucket index → count), so the sliding windows
+    are exact to one bucket and a number costs at most one small dict of a
+    day's buckets. Counts are persisted, so a restart does not reset them.
+
+    A send can also be reserved for the first bucket with room in both
+    windows, which is how deferred messages are spread out.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, per_hour: int, per_day: int
+    ) -> None:
+        """Initialize the quotas (0 = unlimited)."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.quota"
+        )
+        self._limits = tuple(
+            (span, limit)
+            for span, limit in ((HOUR_BUCKETS, per_hour), (DAY_BUCKETS, per_day))
+            if limit > 0
+        )
+        self._counts: dict[str, dict[int, int]] = {}
+        self.exceeded = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if any quota is set."""
+        return bool(self._limits)
+
+    async def async_load(self) -> None:
+        """Load the persisted counts."""
+        stored = await self._store.async_load() or {}
+        self._counts = {
+            number: {bucket: count for bucket, count in buckets}
+            for number, buckets in stored.get("counts", {}).items()
+        }
+        self._prune(int(time.time() // QUOTA_BUCKET_SECONDS))
+
+    async def async_save(self) -> None:
+        """Write pending changes now instead of after the save delay."""
+        await self._store.async_save(self._data_to_save())
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the counts to persist."""
+        self._prune(int(time.time() // QUOTA_BUCKET_SECONDS))
+        return {
+            "counts": {
+                number: list(buckets.items())
+                for number, buckets in self._counts.items()
+            }
+        }
+
+    def _prune(self, now_bucket: int) -> None:
+        """Drop buckets that have left the longest window."""
+        oldest = now_bucket - max((span for span, _ in self._limits), default=0)
+        for number in list(self._counts):
+            buckets = self._counts[number]
+            for bucket in [b for b in buckets if b <= oldest]:
+                del buckets[bucket]
+            if not buckets:
+                del self._counts[number]
+
+    def _has_room(self, buckets: dict[int, int], bucket: int) -> bool:
+        """Return True if one more send in ``bucket`` fits every window."""
+        for span, limit in self._limits:
+            # Windows containing ``bucket`` peak where they end on a counted bucket
+            ends = {bucket} | {b for b in buckets if bucket < b < bucket + span}
+            for end in ends:
+                if sum(c for b, c in buckets.items() if end - span < b <= end) >= limit:
+                    return False
+        return True
+
+    def _next_slot(self, number: str, now_bucket: int) -> int:
+        """Return the first bucket, from now on, with room for ``number``."""
+        buckets = self._counts.get(number, {})
+        # Room can only appear now or when a counted bucket leaves a window
+        candidates = sorted(
+            {now_bucket}
+            | {
+                b + span
+                for b in buckets
+                for span, _ in self._limits
+                if b + span > now_bucket
+            }
+        )
+        for bucket in candidates:
+            if self._has_room(buckets, bucket):
+                return bucket
+        return candidates[-1]
+
+    def retry_in(self, number: str, now: float | None = None) -> float:
+        """Return the seconds until ``number`` may receive an SMS (0 = now)."""
+        if not self._limits:
+            return 0.0
+        now = time.time() if now is None else now
+        now_bucket = int(now // QUOTA_BUCKET_SECONDS)
+        slot = self._next_slot(number, now_bucket)
+        return 0.0 if slot == now_bucket else slot * QUOTA_BUCKET_SECONDS - now
+
+    @callback
+    def async_reserve(self, number: str, now: float | None = None) -> float:
+        """Count one SMS to ``number`` in its next free bucket; return the delay."""
+        if not self._limits:
+            return 0.0
+        now = time.time() if now is None else now
+        now_bucket = int(now // QUOTA_BUCKET_SECONDS)
+        slot = self._next_slot(number, now_bucket)
+        buckets = self._counts.setdefault(number, {})
+        buckets[slot] = buckets.get(slot, 0) + 1
+        self._store.async_delay_save(self._data_to_save, QUOTA_SAVE_DELAY)
+        return 0.0 if slot == now_bucket else slot * QUOTA_BUCKET_SECONDS - now
+
+    def attributes(self) -> dict[str, Any]:
+        """Return the quota state (for diagnostics)."""
+        return {
+            "limits": {
+                "hour" if span == HOUR_BUCKETS else "day": limit
+                for span, limit in self._limits
+            },
+            "tracked_numbers": len(self._counts),
+            "exceeded": self.exceeded,
+        }
@@ -0,0 +1,110 @@
+"""Client-side rate limiting for the SMS.to API."""
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from .const import RATE_LIMIT_MIN_RATE, RATE_LIMIT_RECOVERY_FACTOR
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds."""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        _LOGGER.debug("Ignoring unparsable Retry-After header: %s", value)
+        return None
+
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class SMSToRateLimiter:
+    """Adaptive token bucket shared by every request of an API client.
+
+    Tokens refill at ``rate`` per second up to ``burst``. A 429 response
+    halves the effective rate and pauses the bucket for the server-provided
+    Retry-After; each successful request then grows the rate back towards
+    the configured maximum.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        """Initialize the limiter with a full bucket."""
+        self._max_rate = rate
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Return the current effective rate in requests per second."""
+        return self._rate
+
+    @property
+    def throttled(self) -> bool:
+        """Return True while paused by a 429's Retry-After.
+
+        A reduced rate alone does not count: it only recovers through
+        successful requests, which an entry left out of routing never makes.
+        """
+        return time.monotonic() < self._blocked_until
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last refill."""
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    async def async_acquire(self) -> None:
+        """Wait until a request may be sent, then consume one token."""
+        # The lock keeps waiters in FIFO order and avoids thundering herds
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                wait = self._blocked_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self._rate
+
+                await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        """Record an accepted request and recover the rate after throttling."""
+        if self._rate < self._max_rate:
+            self._rate = min(
+                self._max_rate, self._rate + self._max_rate * RATE_LIMIT_RECOVERY_FACTOR
+            )
+
+    def on_rate_limited(self, retry_after: float | None) -> None:
+        """Back off after a 429, honouring the server's Retry-After if given."""
+        now = time.monotonic()
+        self._refill(now)
+        self._rate = max(RATE_LIMIT_MIN_RATE, self._rate / 2)
+        self._tokens = 0.0
+        pause = retry_after if retry_after is not None else 1 / self._rate
+        self._blocked_until = max(self._blocked_until, now + pause)
+
+        _LOGGER.warning(
+            "SMS.to rate limit hit — pausing %.1fs, rate lowered to %.2f req/s.",
+            pause,
+            self._rate,
+        )
@@ -0,0 +1,61 @@
+"""Retry policy for SMS.to API calls."""
+import asyncio
+import logging
+import random
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TypeVar
+
+from .exceptions import SMSToApiError, SMSToCircuitOpenError
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True, kw_only=True)
+class RetryPolicy:
+    """Bounded retries with exponential backoff and full jitter."""
+
+    attempts: int
+    base_delay: float
+    max_delay: float
+
+    def delay(self, attempt: int) -> float:
+        """Return the randomized delay before retry number ``attempt`` (1-based).
+
+        Full jitter spreads simultaneous retries out, so clients that failed
+        together do not hammer the API together.
+        """
+        ceiling = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return random.uniform(0, ceiling)
+
+    async def async_call(
+        self, func: Callable[[], Awaitable[_T]], label: str
+    ) -> _T:
+        """Await ``func`` and retry it while it fails with a transient error."""
+        attempt = 1
+        while True:
+            try:
+                return await func()
+            except SMSToApiError as err:
+                # An open circuit will not close within inline backoff delays,
+                # and a 429 has already been retried by the rate limiter
+                if (
+                    attempt >= self.attempts
+                    or not err.retryable
+                    or err.status == 429
+                    or isinstance(err, SMSToCircuitOpenError)
+                ):
+                    raise
+                delay = self.delay(attempt)
+                _LOGGER.debug(
+                    "%s failed (attempt %s/%s, status: %s) — retrying in %.2fs.",
+                    label,
+                    attempt,
+                    self.attempts,
+                    err.status,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
@@ -0,0 +1,88 @@
+"""Routing of notify.smsto calls across SMS.to config entries."""
+import itertools
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from .breaker import STATE_OPEN
+from .const import CONF_SENDER_ID, DOMAIN, ROUTING_ROUND_ROBIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def unhealthy_reason(
+    entry_data: dict[str, Any], text: str, recipients: int, check_floor: bool
+) -> str | None:
+    """Return why an entry should not send ``text`` now, or None if it can."""
+    if entry_data["breaker"].state == STATE_OPEN:
+        return "circuit open"
+    if entry_data["limiter"].throttled:
+        return "rate limited"
+    ledger = entry_data["ledger"]
+    if check_floor and ledger.crosses_floor(ledger.estimate(text, recipients)):
+        return "below balance floor"
+    return None
+
+
+class SMSToRouter:
+    """Pick the config entry (SMS.to account / sender) that sends a message.
+
+    An explicit ``entry`` (entry id, title or sender ID) always wins.
+    Otherwise ``failover`` uses the first healthy entry in load order and
+    ``round_robin`` rotates over all healthy entries. An entry is unhealthy
+    while its circuit is open, it is recovering from a 429 or the send
+    would cross its balance floor; if every entry is unhealthy, all of them
+    are considered again.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the router."""
+        self._hass = hass
+        self._turn = itertools.count()
+
+    @property
+    def entries(self) -> list[dict[str, Any]]:
+        """Return the data of every loaded entry, in load order."""
+        return list(self._hass.data.get(DOMAIN, {}).values())
+
+    def select(
+        self,
+        selector: str | None,
+        routing: str,
+        text: str,
+        recipients: int,
+        check_floor: bool = True,
+    ) -> dict[str, Any]:
+        """Return the entry data of the entry that should send the message."""
+        # Entries being unloaded or shut down take no new messages
+        entries = [e for e in self.entries if e["spool"].accepting]
+        if not entries:
+            raise HomeAssistantError("No SMS.to account is accepting messages.")
+
+        if selector:
+            for entry_data in entries:
+                entry = entry_data["entry"]
+                if selector in (
+                    entry.entry_id,
+                    entry.title,
+                    entry.data.get(CONF_SENDER_ID),
+                ):
+                    return entry_data
+            raise HomeAssistantError(f"No SMS.to account matches '{selector}'.")
+
+        healthy = []
+        for entry_data in entries:
+            reason = unhealthy_reason(entry_data, text, recipients, check_floor)
+            if reason is None:
+                healthy.append(entry_data)
+            elif len(entries) > 1:
+                _LOGGER.debug(
+                    "Routing: skipping %s — %s.", entry_data["entry"].title, reason
+                )
+        pool = healthy or entries
+
+        if routing == ROUTING_ROUND_ROBIN:
+            return pool[next(self._turn) % len(pool)]
+        return pool[0]
@@ -4,15 +4,18 @@ from dataclasses import dataclass
 from typing import Any
 
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntity,
     SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
 from .coordinator import SMSToCoordinator
@@ -25,12 +28,14 @@ class SMSToSensorEntityDescription(SensorEntityDescription):
     """Describes an SMS.to sensor entity."""
 
     data_key: str
+    attributes_key: str | None = None
 
 
 SENSOR_DESCRIPTIONS: tuple[SMSToSensorEntityDescription, ...] = (
     SMSToSensorEntityDescription(
         key="balance",
         data_key="balance",
+        attributes_key="ledger",
         translation_key="balance",
         icon="mdi:cash",
         native_unit_of_measurement="EUR",
@@ -43,6 +48,66 @@ SENSOR_DESCRIPTIONS: tuple[SMSToSensorEntityDescription, ...] = (
         icon="mdi:message-text-outline",
         state_class=SensorStateClass.TOTAL,
     ),
+    SMSToSensorEntityDescription(
+        key="sent_today",
+        data_key="sent_today",
+        translation_key="sent_today",
+        icon="mdi:message-arrow-right-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SMSToSensorEntityDescription(
+        key="failed_24h",
+        data_key="failed_24h",
+        translation_key="failed_24h",
+        icon="mdi:message-alert-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SMSToSensorEntityDescription(
+        key="delivery_rate",
+        data_key="delivery_rate",
+        translation_key="delivery_rate",
+        icon="mdi:message-check-outline",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+    ),
+    SMSToSensorEntityDescription(
+        key="suppressed_duplicates",
+        data_key="suppressed_duplicates",
+        attributes_key="dedup",
+        translation_key="suppressed_duplicates",
+        icon="mdi:content-duplicate",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+    ),
+    SMSToSensorEntityDescription(
+        key="send_latency_p50",
+        data_key="send_latency_p50",
+        translation_key="send_latency_p50",
+        icon="mdi:timer-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SMSToSensorEntityDescription(
+        key="send_latency_p95",
+        data_key="send_latency_p95",
+        translation_key="send_latency_p95",
+        icon="mdi:timer-alert-outline",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SMSToSensorEntityDescription(
+        key="api_error_rate",
+        data_key="api_error_rate",
+        attributes_key="api_metrics",
+        translation_key="api_error_rate",
+        icon="mdi:api-off",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
 )
 
 
@@ -87,6 +152,25 @@ class SMSToSensor(CoordinatorEntity[SMSToCoordinator], SensorEntity):
             return None
         return self.coordinator.data.get(self.entity_description.data_key)
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return refresh state for polled values and extra local attributes."""
+        attributes: dict[str, Any] = {}
+
+        endpoint = self.coordinator.endpoint_for(self.entity_description.data_key)
+        if endpoint is not None:
+            attributes["last_refreshed"] = (
+                dt_util.utc_from_timestamp(endpoint.last_success).isoformat()
+                if endpoint.last_success is not None
+                else None
+            )
+            attributes["last_error"] = endpoint.last_error
+
+        if (key := self.entity_description.attributes_key) and self.coordinator.data:
+            attributes.update(self.coordinator.data.get(key) or {})
+
+        return attributes or None
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device info for grouping entities."""
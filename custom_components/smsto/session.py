@@ -0,0 +1,83 @@
+"""Dedicated HTTP connection pool for the SMS.to integration."""
+import asyncio
+import logging
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.util.ssl import get_default_context
+
+from .const import (
+    API_URL_BALANCE,
+    API_URL_MESSAGES,
+    API_URL_SEND,
+    SESSION_DNS_CACHE_SECONDS,
+    SESSION_KEEPALIVE_SECONDS,
+    SESSION_LIMIT_PER_HOST,
+    SESSION_WARMUP_TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Origins the integration talks to, pre-connected at setup
+API_ORIGINS = tuple(
+    dict.fromkeys(
+        f"{parts.scheme}://{parts.netloc}/"
+        for parts in map(urlsplit, (API_URL_SEND, API_URL_BALANCE, API_URL_MESSAGES))
+    )
+)
+
+
+class SMSToSession:
+    """aiohttp session owned by one config entry and tuned for SMS.to.
+
+    Unlike Home Assistant's shared session, its connector keeps idle
+    connections open longer, caches DNS lookups and caps connections per
+    host. ``async_warm_up`` opens a connection to every API host ahead of
+    time, so the first SMS does not pay for DNS, TCP and TLS setup.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Create the connector and session."""
+        self._hass = hass
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                ssl=get_default_context(),
+                limit_per_host=SESSION_LIMIT_PER_HOST,
+                ttl_dns_cache=SESSION_DNS_CACHE_SECONDS,
+                keepalive_timeout=SESSION_KEEPALIVE_SECONDS,
+            ),
+            raise_for_status=False,
+        )
+        self._unsub_close = hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_CLOSE, self._async_close_on_stop
+        )
+
+    async def _async_warm_up_origin(self, origin: str) -> None:
+        """Open (and return to the pool) one connection to ``origin``."""
+        try:
+            async with self.session.head(
+                origin, timeout=aiohttp.ClientTimeout(total=SESSION_WARMUP_TIMEOUT)
+            ):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _LOGGER.debug("Session: could not pre-connect to %s — %s", origin, err)
+
+    async def async_warm_up(self) -> None:
+        """Pre-connect to every SMS.to API host."""
+        await asyncio.gather(*(self._async_warm_up_origin(o) for o in API_ORIGINS))
+        _LOGGER.debug("Session: pre-connected to %s", ", ".join(API_ORIGINS))
+
+    async def _async_close_on_stop(self, _event: Event) -> None:
+        """Close the session when Home Assistant shuts down."""
+        self._unsub_close = None
+        await self.session.close()
+
+    async def async_close(self) -> None:
+        """Close the session (on unload)."""
+        if self._unsub_close is not None:
+            self._unsub_close()
+            self._unsub_close = None
+        await self.session.close()
@@ -0,0 +1,589 @@
+"""Persistent outbound spool for the SMS.to integration."""
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    LANE_BULK,
+    LANE_CRITICAL,
+    LANE_NORMAL,
+    LANES,
+    PRIORITY_LANES,
+    SPOOL_CRITICAL_WORKERS,
+    SPOOL_DRAIN_TIMEOUT,
+    SPOOL_MAX_ATTEMPTS,
+    SPOOL_RESULT_CACHE_SIZE,
+    SPOOL_RETRY_BASE_SECONDS,
+    SPOOL_RETRY_MAX_SECONDS,
+    SPOOL_SAVE_DELAY,
+    SPOOL_WORKERS,
+)
+from .breaker import STATE_OPEN
+from .exceptions import SMSToApiError, SMSToCircuitOpenError
+from .notify import SMSToNotificationService
+from .retry import RetryPolicy
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+
+STATE_PENDING = "pending"
+STATE_SENDING = "sending"
+
+SPOOL_RETRY_POLICY = RetryPolicy(
+    attempts=SPOOL_MAX_ATTEMPTS,
+    base_delay=SPOOL_RETRY_BASE_SECONDS,
+    max_delay=SPOOL_RETRY_MAX_SECONDS,
+)
+
+
+def priority_lane(priority: str | None) -> str:
+    """Return the delivery lane for a ``data.priority`` value."""
+    if not priority:
+        return LANE_NORMAL
+    return PRIORITY_LANES.get(priority.strip().lower(), LANE_NORMAL)
+
+
+def result_for(result: dict[str, Any], target: list[str]) -> dict[str, Any]:
+    """Return the part of a settled result that concerns ``target``.
+
+    Coalesced calls share one spool entry; each caller only sees its own
+    recipients, and the cost is split evenly across the batch.
+    """
+    if "recipients" not in result:
+        return result
+    wanted = set(target)
+    recipients = {n: r for n, r in result["recipients"].items() if n in wanted}
+    sent = sum(1 for r in recipients.values() if r["success"])
+    failed = len(recipients) - sent
+    cost = result["cost"]
+    if cost is not None and result["recipients"]:
+        cost = round(cost * len(recipients) / len(result["recipients"]), 4)
+
+    return {
+        **result,
+        "status": "sent" if not failed else "failed" if not sent else "partial",
+        "message_ids": list(
+            dict.fromkeys(
+                r["message_id"] for r in recipients.values() if r.get("message_id")
+            )
+        ),
+        "cost": cost,
+        "sent": sent,
+        "failed": failed,
+        "recipients": recipients,
+    }
+
+
+class SMSToSpool:
+    """Durable outbound queue drained by background workers.
+
+    Messages are persisted with HA's Store before delivery; the queue file
+    is written with a short delay, so a backlog costs one write per burst
+    rather than one per message. Right before its API request an entry's
+    id is written to a small in-flight journal, which keeps it until the
+    queue file no longer holds the entry. On restart only entries that
+    never reached the API are replayed — an entry that was mid-request when
+    HA stopped is dropped rather than risk a duplicate SMS.
+
+    Entries wait in one of three priority lanes. General workers always
+    drain critical before normal before bulk, and a reserved pool of
+    critical-only workers keeps alarm latency flat however deep the bulk
+    backlog grows.
+
+    Per-recipient outcomes are collected across attempts; once a message
+    is settled its result is handed to everyone waiting in ``async_wait``.
+
+    Stopping is a drain: workers take no new messages, requests already in
+    flight get ``SPOOL_DRAIN_TIMEOUT`` seconds to finish, and everything
+    else is persisted for the next start.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        service: SMSToNotificationService,
+    ) -> None:
+        """Initialize the spool."""
+        self._hass = hass
+        self._entry = entry
+        self._service = service
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.spool"
+        )
+        self._journal: Store[list[str]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.inflight"
+        )
+        # Ids being sent, and ids settled since the queue file was last written
+        self._sending: set[str] = set()
+        self._settled_unsaved: set[str] = set()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._lanes: dict[str, deque[str]] = {lane: deque() for lane in LANES}
+        self._wakeups: list[asyncio.Event] = []
+        self._retry_handles: dict[str, CALLBACK_TYPE] = {}
+        self._workers: list[asyncio.Task] = []
+        # Outcomes collected so far, and final results of settled messages
+        self._outcomes: dict[str, dict[str, Any]] = {}
+        self._results: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._waiters: dict[str, list[asyncio.Future[dict[str, Any]]]] = {}
+        self._listeners: list[Callable[[dict[str, Any], dict[str, Any]], None]] = []
+        self._queue_listeners: list[Callable[[dict[str, Any]], None]] = []
+        self._stopping = False
+
+    @property
+    def accepting(self) -> bool:
+        """Return False once the spool is stopping."""
+        return not self._stopping
+
+    @property
+    def pending(self) -> int:
+        """Return the number of messages waiting in the spool."""
+        return len(self._entries)
+
+    def held_for(self, number: str) -> int:
+        """Return the number of messages to ``number`` held for a later time."""
+        now = time.time()
+        return sum(
+            1
+            for item in self._entries.values()
+            if item["target"] == [number] and item.get("not_before", 0) > now
+        )
+
+    @property
+    def lane_depths(self) -> dict[str, int]:
+        """Return the number of messages waiting in each lane."""
+        return {lane: len(queue) for lane, queue in self._lanes.items()}
+
+    @callback
+    def async_add_listener(
+        self, listener: Callable[[dict[str, Any], dict[str, Any]], None]
+    ) -> CALLBACK_TYPE:
+        """Call ``listener(item, result)`` whenever a message is settled."""
+        self._listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(listener)
+
+        return _remove
+
+    @callback
+    def async_add_queue_listener(
+        self, listener: Callable[[dict[str, Any]], None]
+    ) -> CALLBACK_TYPE:
+        """Call ``listener(item)`` whenever a message is queued or restored."""
+        self._queue_listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._queue_listeners.remove(listener)
+
+        return _remove
+
+    @callback
+    def _push(self, item: dict[str, Any]) -> None:
+        """Put an entry at the back of its lane and wake the workers."""
+        self._lanes[item.get("lane", LANE_NORMAL)].append(item["id"])
+        for wakeup in self._wakeups:
+            wakeup.set()
+
+    async def async_start(self) -> None:
+        """Restore persisted messages and start the delivery workers."""
+        stored = await self._store.async_load() or {}
+        in_flight = set(await self._journal.async_load() or [])
+        dropped = 0
+
+        for item in stored.get("entries", []):
+            if item.get("state") == STATE_SENDING or item["id"] in in_flight:
+                # The request may or may not have reached SMS.to — never replay it
+                _LOGGER.warning(
+                    "Spool: message %s was in flight during shutdown — "
+                    "not resending to avoid a duplicate (targets: %s).",
+                    item["id"],
+                    item["target"],
+                )
+                dropped += 1
+                continue
+            self._entries[item["id"]] = item
+            for listener in list(self._queue_listeners):
+                listener(item)
+            if (wait := item.get("not_before", 0) - time.time()) > 0:
+                self._schedule_retry(item, wait)
+            else:
+                self._push(item)
+
+        if dropped:
+            await self._store.async_save(self._data_to_save())
+        if in_flight:
+            await self._journal.async_save([])
+
+        if self._entries:
+            _LOGGER.info("Spool: replaying %s queued message(s).", len(self._entries))
+
+        pools = (
+            ("critical", (LANE_CRITICAL,), SPOOL_CRITICAL_WORKERS),
+            ("general", (LANE_CRITICAL, LANE_NORMAL, LANE_BULK), SPOOL_WORKERS),
+        )
+        for pool, lanes, count in pools:
+            for index in range(count):
+                wakeup = asyncio.Event()
+                wakeup.set()
+                self._wakeups.append(wakeup)
+                self._workers.append(
+                    self._entry.async_create_background_task(
+                        self._hass,
+                        self._async_worker(lanes, wakeup),
+                        f"{DOMAIN} spool {pool} worker {index} ({self._entry.entry_id})",
+                    )
+                )
+
+    async def async_stop(self, timeout: float = SPOOL_DRAIN_TIMEOUT) -> None:
+        """Drain the requests in flight and persist whatever is still queued.
+
+        Buffered batches and digests must be flushed into the spool before
+        this is called; afterwards ``async_enqueue`` refuses new messages.
+        A message waiting for a retry is persisted and sent after the next
+        start. A request still running after
+        ``timeout`` seconds is cancelled and, like one interrupted by a
+        crash, not replayed.
+        """
+        self._stopping = True
+        for cancel in self._retry_handles.values():
+            cancel()
+        self._retry_handles.clear()
+
+        # Idle workers exit at once; busy ones after their current message
+        for wakeup in self._wakeups:
+            wakeup.set()
+        if self._workers:
+            _, busy = await asyncio.wait(self._workers, timeout=timeout)
+            if busy:
+                _LOGGER.warning(
+                    "Spool: %s request(s) still in flight after %ss — cancelling.",
+                    len(busy),
+                    timeout,
+                )
+                for worker in busy:
+                    worker.cancel()
+                await asyncio.gather(*busy, return_exceptions=True)
+        self._workers.clear()
+        self._wakeups.clear()
+
+        for message_id, waiters in self._waiters.items():
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result({"spool_id": message_id, "status": "queued"})
+        self._waiters.clear()
+
+        await self._store.async_save(self._data_to_save())
+        await self._journal.async_save(self._journal_to_save())
+        _LOGGER.debug("Spool: stopped with %s message(s) queued.", len(self._entries))
+
+    async def async_wait(self, message_id: str, timeout: float) -> dict[str, Any]:
+        """Wait until a message is settled and return its result.
+
+        If it is still queued after ``timeout`` seconds (e.g. waiting for a
+        retry), return its spool id with the status ``queued`` instead.
+        """
+        if (result := self._results.get(message_id)) is not None:
+            return result
+        if message_id not in self._entries:
+            return {"spool_id": message_id, "status": "unknown"}
+
+        waiter = self._hass.loop.create_future()
+        self._waiters.setdefault(message_id, []).append(waiter)
+        try:
+            async with asyncio.timeout(timeout):
+                return await waiter
+        except TimeoutError:
+            return {"spool_id": message_id, "status": "queued"}
+        finally:
+            if message_id in self._waiters:
+                self._waiters[message_id].remove(waiter)
+                if not self._waiters[message_id]:
+                    del self._waiters[message_id]
+
+    @callback
+    def async_enqueue(
+        self,
+        message: str,
+        title: str,
+        target: list[str] | None,
+        data: dict | None,
+        chunk_size: int,
+        max_concurrency: int,
+        delay: float = 0,
+    ) -> str:
+        """Validate and queue a message for delivery; return its spool id.
+
+        With a ``delay`` the message is held for that many seconds first.
+        """
+        if self._stopping:
+            raise HomeAssistantError("The SMS.to delivery queue is shutting down.")
+        self._service.validate_send_args(target, data)
+
+        message_id = uuid.uuid4().hex
+        item = self._entries[message_id] = {
+            "id": message_id,
+            "created": time.time(),
+            "lane": priority_lane((data or {}).get("priority")),
+            "message": message,
+            "title": title,
+            "target": list(target),
+            "data": dict(data or {}),
+            "chunk_size": chunk_size,
+            "max_concurrency": max_concurrency,
+            "attempts": 0,
+            "state": STATE_PENDING,
+        }
+        if delay > 0:
+            item["not_before"] = item["created"] + delay
+        for listener in list(self._queue_listeners):
+            listener(item)
+        self._store.async_delay_save(self._data_to_save, SPOOL_SAVE_DELAY)
+        if delay > 0:
+            self._schedule_retry(item, delay)
+        else:
+            self._push(item)
+
+        _LOGGER.debug(
+            "Spool: queued message %s for %s target(s) in the %s lane.",
+            message_id,
+            len(target),
+            item["lane"],
+        )
+        return message_id
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the spool contents to persist."""
+        # Settled entries leave the queue file with this write
+        self._settled_unsaved.clear()
+        return {"entries": list(self._entries.values())}
+
+    @callback
+    def _journal_to_save(self) -> list[str]:
+        """Return the ids a restart must not replay."""
+        return [*self._sending, *self._settled_unsaved]
+
+    @callback
+    def _release(self, item: dict[str, Any], settled: bool) -> None:
+        """Take an entry out of the in-flight journal after its attempt."""
+        self._sending.discard(item["id"])
+        if settled:
+            self._entries.pop(item["id"], None)
+            self._settled_unsaved.add(item["id"])
+        self._store.async_delay_save(self._data_to_save, SPOOL_SAVE_DELAY)
+        self._journal.async_delay_save(self._journal_to_save, SPOOL_SAVE_DELAY)
+
+    def _pop(self, lanes: tuple[str, ...]) -> str | None:
+        """Return the next entry id from the highest-priority non-empty lane."""
+        for lane in lanes:
+            if self._lanes[lane]:
+                return self._lanes[lane].popleft()
+        return None
+
+    async def _async_worker(
+        self, lanes: tuple[str, ...], wakeup: asyncio.Event
+    ) -> None:
+        """Deliver queued messages from ``lanes`` until the spool stops."""
+        while not self._stopping:
+            if (message_id := self._pop(lanes)) is None:
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+            if (item := self._entries.get(message_id)) is None:
+                continue
+            try:
+                await self._async_deliver(item)
+            except Exception as err:  # a worker must never die
+                _LOGGER.exception("Spool: unexpected error delivering %s.", message_id)
+                self._fail(item, f"Unexpected error: {err}")
+
+    @callback
+    def _fail(self, item: dict[str, Any], error: str) -> None:
+        """Settle an entry as failed for every recipient without an outcome."""
+        outcome = self._outcomes.setdefault(item["id"], {"recipients": {}, "costs": []})
+        for number in item["target"]:
+            outcome["recipients"].setdefault(
+                number,
+                {"success": False, "message_id": None, "status": None, "error": error},
+            )
+        self._release(item, settled=True)
+        self._settle(item)
+
+    async def _async_deliver(self, item: dict[str, Any]) -> None:
+        """Send one spooled message and settle its entry."""
+        breaker = self._service.breaker
+        if breaker is not None and breaker.state == STATE_OPEN:
+            # Hold the message while the API is down rather than burn attempts
+            self._schedule_retry(item, max(breaker.retry_in, 1))
+            return
+
+        item["state"] = STATE_SENDING
+        item["attempts"] += 1
+        # Journal the id now so a crash mid-request is detected on the next start
+        self._sending.add(item["id"])
+        await self._journal.async_save(self._journal_to_save())
+
+        retry_targets: list[str] = []
+        error: str | None = None
+        # Whether any request got past the circuit breaker
+        reached_api = True
+        outcome = self._outcomes.setdefault(item["id"], {"recipients": {}, "costs": []})
+
+        if len(item["target"]) > item["chunk_size"]:
+            result = await self._service.async_send_bulk(
+                message=item["message"],
+                title=item["title"],
+                target=item["target"],
+                data=item["data"],
+                chunk_size=item["chunk_size"],
+                max_concurrency=item["max_concurrency"],
+                idempotency_key=item["id"],
+            )
+            outcome["recipients"].update(result["recipients"])
+            if result["cost"] is not None:
+                outcome["costs"].append(result["cost"])
+            reached_api = not all(chunk["circuit_open"] for chunk in result["chunks"])
+            for chunk in result["chunks"]:
+                if chunk["success"]:
+                    continue
+                error = chunk["error"]
+                if chunk["retryable"]:
+                    retry_targets.extend(chunk["targets"])
+                else:
+                    _LOGGER.error(
+                        "Spool: message %s rejected for %s — %s",
+                        item["id"],
+                        chunk["targets"],
+                        chunk["error"],
+                    )
+        else:
+            try:
+                result = await self._service.async_send_message(
+                    message=item["message"],
+                    title=item["title"],
+                    target=item["target"],
+                    data=item["data"],
+                    idempotency_key=item["id"],
+                )
+            except SMSToApiError as err:
+                error = str(err)
+                reached_api = not isinstance(err, SMSToCircuitOpenError)
+                for number in item["target"]:
+                    outcome["recipients"][number] = {
+                        "success": False,
+                        "message_id": None,
+                        "status": None,
+                        "error": error,
+                    }
+                if err.retryable:
+                    retry_targets = item["target"]
+                else:
+                    _LOGGER.error(
+                        "Spool: message %s rejected — %s", item["id"], err
+                    )
+            else:
+                outcome["recipients"].update(result["recipients"])
+                if result["cost"] is not None:
+                    outcome["costs"].append(result["cost"])
+
+        if not reached_api:
+            # Rejected by an open circuit: not an attempt; wait for the probe
+            item["attempts"] -= 1
+            item["state"] = STATE_PENDING
+            self._release(item, settled=False)
+            self._schedule_retry(item, max(breaker.retry_in, 1))
+        elif retry_targets and item["attempts"] < SPOOL_RETRY_POLICY.attempts:
+            item["target"] = retry_targets
+            item["state"] = STATE_PENDING
+            self._release(item, settled=False)
+            self._schedule_retry(item)
+        else:
+            if retry_targets:
+                _LOGGER.error(
+                    "Spool: giving up on message %s after %s attempts — %s",
+                    item["id"],
+                    item["attempts"],
+                    error,
+                )
+            self._release(item, settled=True)
+            self._settle(item)
+
+    @callback
+    def _settle(self, item: dict[str, Any]) -> None:
+        """Build the final result of a message and notify its waiters."""
+        message_id = item["id"]
+        outcome = self._outcomes.pop(message_id, {"recipients": {}, "costs": []})
+        recipients = outcome["recipients"]
+        sent = sum(1 for r in recipients.values() if r["success"])
+        failed = len(recipients) - sent
+        costs = outcome["costs"]
+
+        result = {
+            "spool_id": message_id,
+            "status": "sent" if not failed else "failed" if not sent else "partial",
+            "message_ids": list(
+                dict.fromkeys(
+                    r["message_id"] for r in recipients.values() if r.get("message_id")
+                )
+            ),
+            "cost": round(sum(float(c) for c in costs), 4) if costs else None,
+            "sent": sent,
+            "failed": failed,
+            "recipients": recipients,
+        }
+
+        self._results[message_id] = result
+        if len(self._results) > SPOOL_RESULT_CACHE_SIZE:
+            self._results.popitem(last=False)
+        for waiter in self._waiters.pop(message_id, []):
+            if not waiter.done():
+                waiter.set_result(result)
+        for listener in list(self._listeners):
+            listener(item, result)
+
+    @callback
+    def _schedule_retry(
+        self, item: dict[str, Any], delay: float | None = None
+    ) -> None:
+        """Re-queue an entry after ``delay`` or an exponential backoff delay."""
+        if self._stopping:
+            # Persisted as pending; retried after the next start
+            return
+        held = delay is not None
+        if delay is None:
+            delay = SPOOL_RETRY_POLICY.delay(item["attempts"])
+        message_id = item["id"]
+
+        @callback
+        def _async_requeue(_now: Any) -> None:
+            self._retry_handles.pop(message_id, None)
+            if message_id in self._entries:
+                self._push(self._entries[message_id])
+
+        self._retry_handles[message_id] = async_call_later(
+            self._hass, delay, _async_requeue
+        )
+        if held:
+            _LOGGER.debug("Spool: holding message %s for %.0fs.", message_id, delay)
+            return
+        _LOGGER.warning(
+            "Spool: message %s failed (attempt %s) — retrying in %.0fs.",
+            message_id,
+            item["attempts"],
+            delay,
+        )
@@ -0,0 +1,113 @@
+"""Delivery-report webhook for the SMS.to integration."""
+from http import HTTPStatus
+import logging
+from typing import Any
+
+from aiohttp import web
+
+from homeassistant.components import webhook
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.network import NoURLAvailableError
+
+from .const import CONF_WEBHOOK_ID, DOMAIN, EVENT_DELIVERY_REPORT
+from .coordinator import SMSToCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _first(report: dict[str, Any], *keys: str) -> Any:
+    """Return the first non-empty value of ``keys`` in a report."""
+    for key in keys:
+        if report.get(key) not in (None, ""):
+            return report[key]
+    return None
+
+
+async def _async_read_reports(request: web.Request) -> list[dict[str, Any]]:
+    """Return the delivery reports of a callback, sent as JSON or as a form."""
+    if request.content_type == "application/json":
+        body = await request.json()
+    else:
+        body = dict(await request.post())
+    reports = body if isinstance(body, list) else [body]
+    return [report for report in reports if isinstance(report, dict)]
+
+
+def async_setup_webhook(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: SMSToCoordinator
+) -> str | None:
+    """Register the delivery-report webhook of an entry and return its URL.
+
+    Returns None when Home Assistant has no external URL, since SMS.to
+    could not reach the webhook; delivery tracking then relies on polling.
+    An entry without a webhook id (new, or from an older version) gets one.
+    """
+    if CONF_WEBHOOK_ID not in entry.data:
+        hass.config_entries.async_update_entry(
+            entry, data={**entry.data, CONF_WEBHOOK_ID: webhook.async_generate_id()}
+        )
+    webhook_id: str = entry.data[CONF_WEBHOOK_ID]
+    history = coordinator.history
+
+    async def _async_handle_webhook(
+        hass: HomeAssistant, webhook_id: str, request: web.Request
+    ) -> web.Response | None:
+        """Apply the delivery reports posted by SMS.to."""
+        try:
+            reports = await _async_read_reports(request)
+        except ValueError:
+            _LOGGER.warning("Webhook: ignoring a delivery report that is not valid JSON.")
+            return web.Response(status=HTTPStatus.BAD_REQUEST)
+
+        for report in reports:
+            message_id = _first(report, "messageId", "message_id", "_id", "id")
+            status = _first(report, "status")
+            if message_id is None or status is None:
+                _LOGGER.debug("Webhook: skipping incomplete report %s", report)
+                continue
+
+            cost = _first(report, "price", "cost")
+            try:
+                cost = float(cost) if cost is not None else None
+            except (TypeError, ValueError):
+                cost = None
+
+            history.async_update_record(str(message_id), str(status), cost=cost)
+            hass.bus.async_fire(
+                EVENT_DELIVERY_REPORT,
+                {
+                    "entry_id": entry.entry_id,
+                    "message_id": str(message_id),
+                    "status": str(status).upper(),
+                    "phone": _first(report, "phone", "to"),
+                    "cost": cost,
+                },
+            )
+            _LOGGER.debug("Webhook: message %s is now %s.", message_id, status)
+
+        # The history is shared by every entry of the account
+        coordinator.account.async_set_local_data(history.statistics())
+        return None
+
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        "SMS.to delivery reports",
+        webhook_id,
+        _async_handle_webhook,
+        allowed_methods=["POST"],
+    )
+    entry.async_on_unload(lambda: webhook.async_unregister(hass, webhook_id))
+
+    try:
+        url = webhook.async_generate_url(hass, webhook_id, allow_internal=False)
+    except NoURLAvailableError:
+        _LOGGER.info(
+            "No external URL configured — delivery reports will not be pushed; "
+            "message status is polled instead."
+        )
+        return None
+
+    _LOGGER.debug("Delivery-report webhook registered for entry %s.", entry.entry_id)
+    return url
@@ -0,0 +1 @@
+"""Tests for the SMS.to integration."""
@@ -0,0 +1,28 @@
+"""Fixtures for the SMS.to integration tests."""
+from collections.abc import AsyncGenerator
+from pathlib import Path
+import sys
+
+import pytest
+
+# The stub SMS.to API lives with the benchmarks
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+
+from bench_smsto import use_stub  # noqa: E402
+from stub_server import SMSToStubServer, StubConfig  # noqa: E402
+
+pytest_plugins = "pytest_homeassistant_custom_component"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations: None) -> None:
+    """Allow loading custom_components/smsto."""
+
+
+@pytest.fixture
+async def stub_api(socket_enabled: None) -> AsyncGenerator[SMSToStubServer]:
+    """Point the integration at a local stub of the SMS.to API (on 127.0.0.1)."""
+    stub = SMSToStubServer(StubConfig(latency_ms=0, jitter_ms=0))
+    use_stub(await stub.async_start())
+    yield stub
+    await stub.async_stop()
@@ -0,0 +1,46 @@
+"""Setup and unload smoke test for the SMS.to integration."""
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from bench_smsto import _free_port
+from custom_components.smsto.const import (
+    CONF_API_KEY,
+    CONF_SENDER_ID,
+    CONF_WEBHOOK_ID,
+    DOMAIN,
+)
+from stub_server import SMSToStubServer
+
+
+async def test_setup_send_unload(hass: HomeAssistant, stub_api: SMSToStubServer) -> None:
+    """An entry sets up, sends through notify.smsto and unloads cleanly."""
+    assert await async_setup_component(
+        hass, "http", {"http": {"server_port": _free_port()}}
+    )
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={CONF_API_KEY: "test-api-key", CONF_SENDER_ID: "TEST"}
+    )
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.LOADED
+    assert CONF_WEBHOOK_ID in entry.data
+    assert hass.services.has_service("notify", "smsto")
+
+    response = await hass.services.async_call(
+        "notify",
+        "smsto",
+        {"message": "Smoke test", "target": ["+40700000000"]},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["status"] == "sent"
+    assert response["sent"] == 1
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert entry.state is ConfigEntryState.NOT_LOADED
+    assert not hass.services.has_service("notify", "smsto")